@@ -11,6 +11,9 @@ from models.cargo import Cargo
 @dataclass
 class TankAssignment:
     """Represents a cargo assignment to a tank"""
+    # Plans hold many assignments (one per loaded tank, per candidate plan)
+    __slots__ = ('tank_id', 'cargo', 'quantity_loaded')
+    
     tank_id: str
     cargo: Cargo
     quantity_loaded: float  # Actual quantity loaded in this tank
@@ -186,9 +189,12 @@ class StowagePlan:
             created_date = datetime.fromisoformat(data['created_date'])
         
         # Load excluded tanks (backward compatible - if not present, use empty list)
+        # (copied, so the plan never shares a list with data)
         excluded_tanks = data.get('excluded_tanks', [])
         if excluded_tanks is None:
             excluded_tanks = []
+        else:
+            excluded_tanks = list(excluded_tanks)
         
         return cls(
             id=data.get('id', ''),
@@ -8,6 +8,8 @@ import uuid
 @dataclass
 class Tank:
     """Represents a single tank on a ship"""
+    __slots__ = ('id', 'name', 'volume')
+    
     id: str
     name: str
     volume: float  # Volume in m³ or tons
@@ -1,8 +1,10 @@
 """Genetic Algorithm optimizer for tanker stowage planning"""
 
-from typing import List, Dict, Optional, Tuple, Set
+from typing import List, Dict, Optional, Tuple, Set, NamedTuple
 from dataclasses import dataclass
 import random
+import heapq
+from operator import attrgetter, itemgetter
 from models.ship import Ship, Tank
 from models.cargo import Cargo, Receiver
 from models.plan import StowagePlan, TankAssignment
@@ -43,6 +45,110 @@ class Chromosome:
             self.genes[tank_index] = (cargo_id, quantity)
 
 
+class _FitnessTables(NamedTuple):
+    """Precomputed inputs for the fitness kernel
+    
+    Everything the fitness function needs is flattened into gene-indexed
+    lists and plain numbers so evaluation never touches Ship/Cargo objects.
+    """
+    cargo_index: Dict[str, int]  # cargo unique_id -> dense cargo index
+    gene_side: List[int]  # 0 = port, 1 = starboard (per gene)
+    gene_row: List[int]  # row number (per gene)
+    pair_gene_indices: List[Tuple[int, int]]  # (port gene, starboard gene) pairs
+    symmetry_penalty_coef: float
+    trim_penalty_coef: float
+    operational_penalty_coef: float
+    ideal_lcg_position: float
+    total_rows: int
+
+
+def _fitness_kernel(genes: List[Tuple[Optional[str], float]], tables: _FitnessTables) -> float:
+    """Calculate fitness for a single gene list
+    
+    Fitness = Total_Loaded_Weight - Symmetry_Penalty - Trim_Penalty - Operational_Penalty
+    
+    Args:
+        genes: (cargo_id, quantity) per tank
+        tables: Precomputed fitness tables of the optimizer
+        
+    Returns:
+        Fitness score (higher is better)
+    """
+    return _batch_fitness([genes], tables)[0]
+
+
+def _batch_fitness(genes_batch: List[List[Tuple[Optional[str], float]]],
+                   tables: _FitnessTables) -> List[float]:
+    """Calculate fitness for a batch of gene lists
+    
+    Table unpacking and per-cargo counter allocation happen once per batch;
+    each gene list is then scored in a single pass.
+    
+    Args:
+        genes_batch: Gene lists ((cargo_id, quantity) per tank) to evaluate
+        tables: Precomputed fitness tables of the optimizer
+        
+    Returns:
+        Fitness score per gene list (higher is better)
+    """
+    (cargo_index, gene_side, gene_row, pair_gene_indices, symmetry_coef,
+     trim_coef, operational_coef, ideal_lcg_position, total_rows) = tables
+    
+    n_cargos = len(cargo_index)
+    zeros = [0] * n_cargos
+    tank_counts = [0] * n_cargos
+    side_bits = [0] * n_cargos  # bit 0 = port, bit 1 = starboard
+    fitness_scores = []
+    
+    for genes in genes_batch:
+        tank_counts[:] = zeros
+        side_bits[:] = zeros
+        total_loaded = 0.0
+        total_weight = 0.0
+        weighted_position = 0.0
+        
+        # Single pass: total loaded, tanks/sides per cargo and LCG moments
+        for i, (cargo_id, qty) in enumerate(genes):
+            total_loaded += qty
+            if cargo_id is not None and qty > 0.001:
+                c = cargo_index[cargo_id]
+                tank_counts[c] += 1
+                side_bits[c] |= 1 << gene_side[i]
+                total_weight += qty
+                weighted_position += qty * gene_row[i]
+        
+        # Symmetry: cargo in 2+ tanks should not be all on the same side
+        symmetry_penalty = 0.0
+        operational_penalty = 0.0
+        for num_tanks, sides in zip(tank_counts, side_bits):
+            if num_tanks >= 2 and sides != 3:
+                symmetry_penalty += symmetry_coef * num_tanks
+            # Operational: prefer fewer tanks per receiver (quadratic)
+            if num_tanks > 1:
+                operational_penalty += operational_coef * (num_tanks - 1) ** 2
+        
+        # Symmetry: port/starboard pair balance (more than 10% imbalance)
+        for port_idx, starboard_idx in pair_gene_indices:
+            port_qty = genes[port_idx][1]
+            starboard_qty = genes[starboard_idx][1]
+            avg_weight = (port_qty + starboard_qty) / 2.0
+            if avg_weight > 0.001:
+                imbalance_ratio = abs(port_qty - starboard_qty) / avg_weight
+                if imbalance_ratio > 0.1:
+                    symmetry_penalty += symmetry_coef * imbalance_ratio * 0.1
+        
+        # Trim: deviation of LCG from ideal position, normalized by total rows
+        trim_penalty = 0.0
+        if total_weight >= 0.001:
+            deviation = abs(weighted_position / total_weight - ideal_lcg_position)
+            normalized_deviation = deviation / total_rows if total_rows > 0 else 0
+            trim_penalty = trim_coef * normalized_deviation
+        
+        fitness_scores.append(total_loaded - symmetry_penalty - trim_penalty - operational_penalty)
+    
+    return fitness_scores
+
+
 class GeneticOptimizer:
     """Genetic Algorithm optimizer for tanker stowage planning"""
     
@@ -87,6 +193,23 @@ class GeneticOptimizer:
             if tank.id not in self.excluded_tanks
         ]
         self.tank_ids = [tank.id for tank in self.available_tanks]
+        self.tank_by_id = {tank.id: tank for tank in self.available_tanks}
+        
+        # Precompute gene-indexed layout tables so fitness evaluation never
+        # has to search ship.tanks or self.tank_ids
+        ship_tank_index = {tank.id: idx for idx, tank in enumerate(ship.tanks)}
+        gene_index = {tank_id: i for i, tank_id in enumerate(self.tank_ids)}
+        self._gene_side = [ship_tank_index[tank_id] % 2 for tank_id in self.tank_ids]  # 0 = port, 1 = starboard
+        self._gene_row = [ship_tank_index[tank_id] // 2 + 1 for tank_id in self.tank_ids]
+        self._pair_gene_indices = [
+            (gene_index[port_tank.id], gene_index[starboard_tank.id])
+            for port_tank, starboard_tank in ship.get_tank_pairs()
+            if port_tank.id in gene_index and starboard_tank.id in gene_index
+        ]
+        
+        # Dense integer index per cargo (used for per-cargo counters instead of dicts)
+        self._cargo_index = {cargo.unique_id: i for i, cargo in enumerate(cargo_requests)}
+        self._cargo_map = {cargo.unique_id: cargo for cargo in cargo_requests}
         
         # Calculate available tank volumes (only for non-excluded tanks)
         self.tank_volumes = {}
@@ -116,10 +239,28 @@ class GeneticOptimizer:
         self.total_rows = (len(self.ship.tanks) + 1) // 2
         self.ideal_lcg_position = settings.get('ga_ideal_lcg_position', self.total_rows / 2.0)  # Geometric center
         
-        # Track best fitness for convergence
-        self.best_fitness_history = []
+        # Track best fitness for convergence (preallocated, filled up to _history_len)
+        self._fitness_history = [0.0] * (self.max_generations + 1)
+        self._history_len = 0
         self.convergence_threshold = settings.get('ga_convergence_threshold', 0.0001)
         self.convergence_generations = settings.get('ga_convergence_generations', 60)
+        
+        self._fitness_tables = _FitnessTables(
+            cargo_index=self._cargo_index,
+            gene_side=self._gene_side,
+            gene_row=self._gene_row,
+            pair_gene_indices=self._pair_gene_indices,
+            symmetry_penalty_coef=self.symmetry_penalty_coef,
+            trim_penalty_coef=self.trim_penalty_coef,
+            operational_penalty_coef=self.operational_penalty_coef,
+            ideal_lcg_position=self.ideal_lcg_position,
+            total_rows=self.total_rows
+        )
+    
+    @property
+    def best_fitness_history(self) -> List[float]:
+        """Best fitness per generation of the last optimize() run"""
+        return self._fitness_history[:self._history_len]
     
     def _place_mandatory_cargos(self, available_tanks: Dict[str, float], 
                                settings: Dict) -> Dict[str, float]:
@@ -137,22 +278,24 @@ class GeneticOptimizer:
         # Reset mandatory assignments
         self.mandatory_assignments = {}
         
+        tank_by_id = self.tank_by_id
+        
         for cargo in self.mandatory_cargos:
             remaining_qty = cargo.quantity
             
             # Sort tanks by available volume (descending)
             sorted_tanks = sorted(
-                [(tid, vol, self.ship.get_tank_by_id(tid)) 
-                 for tid, vol in available_tanks.items() if vol > 0.001],
-                key=lambda x: x[1],
+                [item for item in available_tanks.items() if item[1] > 0.001],
+                key=itemgetter(1),
                 reverse=True
             )
             
             # Greedy assignment: place in largest available tanks
-            for tank_id, available_vol, tank in sorted_tanks:
+            for tank_id, available_vol in sorted_tanks:
                 if remaining_qty < 0.001:
                     break
                 
+                tank = tank_by_id.get(tank_id)
                 if not tank:
                     continue
                 
@@ -198,6 +341,12 @@ class GeneticOptimizer:
         """Create a random chromosome (may violate constraints initially)"""
         genes = [(None, 0.0) for _ in self.tank_ids]
         
+        # Random tank indices are drawn in blocks of one per tank (a single
+        # random.choices call) and refilled when used up, instead of one
+        # randint call per placement attempt
+        tank_range = range(len(self.tank_ids))
+        random_tanks = []
+        
         # Randomly assign cargo to tanks (only regular cargos, mandatory already placed)
         for cargo in self.regular_cargos:
             remaining_qty = cargo.quantity
@@ -210,7 +359,9 @@ class GeneticOptimizer:
                 attempts += 1
                 
                 # Randomly select a tank
-                tank_idx = random.randint(0, len(self.tank_ids) - 1)
+                if not random_tanks:
+                    random_tanks = random.choices(tank_range, k=len(tank_range))
+                tank_idx = random_tanks.pop()
                 tank_id = self.tank_ids[tank_idx]
                 tank_volume = self.tank_volumes[tank_id]
                 
@@ -252,13 +403,18 @@ class GeneticOptimizer:
                     # Reduce to capacity
                     repaired.genes[i] = (cargo_id, tank_volume)
         
+        # Loaded total per cargo in a single pass over the genes. Repairing one
+        # cargo only touches its own or empty tanks, so the other totals stay valid.
+        cargo_index = self._cargo_index
+        cargo_totals = [0.0] * len(cargo_index)
+        for cargo_id, qty in repaired.genes:
+            if cargo_id is not None:
+                cargo_totals[cargo_index[cargo_id]] += qty
+        
         # Fix receiver quantity violations (try to balance)
         # Only check regular cargos (mandatory already placed)
         for cargo in self.regular_cargos:
-            total_loaded = sum(
-                qty for cargo_id, qty in repaired.genes
-                if cargo_id == cargo.unique_id
-            )
+            total_loaded = cargo_totals[cargo_index[cargo.unique_id]]
             
             # Check if within tolerance
             min_allowed = cargo.quantity * (1 - self.receiver_tolerance)
@@ -323,153 +479,7 @@ class GeneticOptimizer:
         Returns:
             Fitness score (higher is better)
         """
-        # Calculate total loaded weight/volume (main objective)
-        total_loaded = sum(qty for _, qty in chromosome.genes)
-        
-        # Calculate penalties
-        symmetry_penalty = self._calculate_symmetry_penalty(chromosome)
-        trim_penalty = self._calculate_trim_penalty(chromosome)
-        operational_penalty = self._calculate_operational_penalty(chromosome)
-        
-        # Fitness = total loaded - penalties
-        fitness = total_loaded - symmetry_penalty - trim_penalty - operational_penalty
-        
-        return fitness
-    
-    def _calculate_symmetry_penalty(self, chromosome: Chromosome) -> float:
-        """Calculate penalty for transverse imbalance (symmetry constraint)
-        
-        For cargo requiring 2+ tanks, they should not all be on the same side.
-        Penalty is applied for each pair of tanks that are unbalanced.
-        """
-        penalty = 0.0
-        
-        # Get tank pairs (port/starboard pairs)
-        tank_pairs = self.ship.get_tank_pairs()
-        
-        # For each cargo that uses 2+ tanks, check symmetry
-        cargo_tank_map = {}  # cargo_id -> list of tank_ids
-        for i, (cargo_id, qty) in enumerate(chromosome.genes):
-            if cargo_id is not None and qty > 0.001:
-                tank_id = chromosome.tank_ids[i]
-                if cargo_id not in cargo_tank_map:
-                    cargo_tank_map[cargo_id] = []
-                cargo_tank_map[cargo_id].append(tank_id)
-        
-        # Check each cargo with 2+ tanks
-        for cargo_id, tank_ids in cargo_tank_map.items():
-            if len(tank_ids) >= 2:
-                # Check if all tanks are on same side
-                if self._all_tanks_same_side(tank_ids):
-                    # Apply penalty based on number of tanks and imbalance
-                    penalty += self.symmetry_penalty_coef * len(tank_ids)
-        
-        # Also check balance for each tank pair
-        for port_tank, starboard_tank in tank_pairs:
-            port_id = port_tank.id
-            starboard_id = starboard_tank.id
-            
-            if port_id not in self.tank_ids or starboard_id not in self.tank_ids:
-                continue
-            
-            port_idx = self.tank_ids.index(port_id)
-            starboard_idx = self.tank_ids.index(starboard_id)
-            
-            port_cargo, port_qty = chromosome.genes[port_idx]
-            starboard_cargo, starboard_qty = chromosome.genes[starboard_idx]
-            
-            # Calculate weight difference
-            weight_diff = abs(port_qty - starboard_qty)
-            
-            # Apply penalty if difference is significant (more than 10% of average)
-            avg_weight = (port_qty + starboard_qty) / 2.0
-            if avg_weight > 0.001:
-                imbalance_ratio = weight_diff / avg_weight
-                if imbalance_ratio > 0.1:  # More than 10% imbalance
-                    penalty += self.symmetry_penalty_coef * imbalance_ratio * 0.1
-        
-        return penalty
-    
-    def _all_tanks_same_side(self, tank_ids: List[str]) -> bool:
-        """Check if all tanks are on the same side (port or starboard)"""
-        if not tank_ids:
-            return False
-        
-        first_pos = self.ship.get_tank_position_info(tank_ids[0])
-        if not first_pos:
-            return False
-        
-        first_side = first_pos['side']
-        for tank_id in tank_ids[1:]:
-            pos_info = self.ship.get_tank_position_info(tank_id)
-            if not pos_info or pos_info['side'] != first_side:
-                return False
-        
-        return True
-    
-    def _calculate_trim_penalty(self, chromosome: Chromosome) -> float:
-        """Calculate penalty for longitudinal imbalance (trim constraint)
-        
-        Penalty based on deviation of LCG (Longitudinal Center of Gravity) from ideal position.
-        """
-        if len(self.tank_ids) == 0:
-            return 0.0
-        
-        # Calculate LCG
-        total_weight = 0.0
-        weighted_position = 0.0
-        
-        for i, (cargo_id, qty) in enumerate(chromosome.genes):
-            if cargo_id is not None and qty > 0.001:
-                tank_id = chromosome.tank_ids[i]
-                pos_info = self.ship.get_tank_position_info(tank_id)
-                
-                if pos_info:
-                    row_number = pos_info['row_number']
-                    total_weight += qty
-                    weighted_position += qty * row_number
-        
-        if total_weight < 0.001:
-            return 0.0
-        
-        # Calculate actual LCG position
-        actual_lcg = weighted_position / total_weight
-        
-        # Calculate deviation from ideal
-        deviation = abs(actual_lcg - self.ideal_lcg_position)
-        
-        # Normalize deviation (as ratio of total rows)
-        normalized_deviation = deviation / self.total_rows if self.total_rows > 0 else 0
-        
-        # Apply penalty proportional to deviation
-        penalty = self.trim_penalty_coef * normalized_deviation
-        
-        return penalty
-    
-    def _calculate_operational_penalty(self, chromosome: Chromosome) -> float:
-        """Calculate penalty for operational inefficiency
-        
-        Penalty for each receiver using too many tanks (prefer fewer tanks per receiver).
-        """
-        penalty = 0.0
-        
-        # Count tanks used per receiver
-        receiver_tank_count = {}  # cargo_id -> set of tank indices
-        
-        for i, (cargo_id, qty) in enumerate(chromosome.genes):
-            if cargo_id is not None and qty > 0.001:
-                if cargo_id not in receiver_tank_count:
-                    receiver_tank_count[cargo_id] = set()
-                receiver_tank_count[cargo_id].add(i)
-        
-        # Apply penalty for each receiver based on number of tanks used
-        for cargo_id, tank_indices in receiver_tank_count.items():
-            num_tanks = len(tank_indices)
-            if num_tanks > 1:
-                # Penalty increases with number of tanks (quadratic)
-                penalty += self.operational_penalty_coef * (num_tanks - 1) ** 2
-        
-        return penalty
+        return _fitness_kernel(chromosome.genes, self._fitness_tables)
     
     def tournament_selection(self, population: List[Chromosome], 
                             fitness_scores: List[float]) -> Chromosome:
@@ -482,20 +492,31 @@ class GeneticOptimizer:
         Returns:
             Selected chromosome
         """
-        # Randomly select tournament_size individuals
-        tournament_indices = random.sample(range(len(population)), 
-                                         min(self.tournament_size, len(population)))
-        
-        # Find the best in tournament
-        best_idx = tournament_indices[0]
-        best_fitness = fitness_scores[best_idx]
+        best_idx = self._select_parent_indices(fitness_scores, 1)[0]
+        return population[best_idx].copy()
+    
+    def _select_parent_indices(self, fitness_scores: List[float], count: int) -> List[int]:
+        """Run `count` tournaments at once and return the winners' indices
         
-        for idx in tournament_indices[1:]:
-            if fitness_scores[idx] > best_fitness:
-                best_fitness = fitness_scores[idx]
-                best_idx = idx
+        All contestants are drawn in a single call (with replacement) instead
+        of sampling separately for every tournament.
         
-        return population[best_idx].copy()
+        Args:
+            fitness_scores: Fitness scores for each chromosome
+            count: Number of parents to select
+            
+        Returns:
+            Population indices of the selected parents
+        """
+        tournament_size = self.tournament_size
+        contestants = random.choices(range(len(fitness_scores)), k=count * tournament_size)
+        fitness_of = fitness_scores.__getitem__
+        
+        # Best in each tournament (first one wins ties)
+        return [
+            max(contestants[start:start + tournament_size], key=fitness_of)
+            for start in range(0, len(contestants), tournament_size)
+        ]
     
     def roulette_wheel_selection(self, population: List[Chromosome],
                                 fitness_scores: List[float]) -> Chromosome:
@@ -528,13 +549,14 @@ class GeneticOptimizer:
         selected = random.choices(population, weights=probabilities, k=1)[0]
         return selected.copy()
     
-    def two_point_crossover(self, parent1: Chromosome, 
-                           parent2: Chromosome) -> Tuple[Chromosome, Chromosome]:
+    def two_point_crossover(self, parent1: Chromosome, parent2: Chromosome,
+                           points: Optional[Tuple[int, int]] = None) -> Tuple[Chromosome, Chromosome]:
         """Perform two-point crossover between two parents
         
         Args:
             parent1: First parent chromosome
             parent2: Second parent chromosome
+            points: Optional pre-drawn crossover points (random if not given)
             
         Returns:
             Tuple of two offspring chromosomes
@@ -544,22 +566,24 @@ class GeneticOptimizer:
             return parent1.copy(), parent2.copy()
         
         # Select two random crossover points
-        point1 = random.randint(0, len(parent1.genes) - 1)
-        point2 = random.randint(0, len(parent1.genes) - 1)
+        if points is None:
+            point1 = random.randint(0, len(parent1.genes) - 1)
+            point2 = random.randint(0, len(parent1.genes) - 1)
+        else:
+            point1, point2 = points
         
         if point1 > point2:
             point1, point2 = point2, point1
         
-        # Create offspring
-        offspring1 = Chromosome(
-            genes=parent1.genes[:point1] + parent2.genes[point1:point2] + parent1.genes[point2:],
-            tank_ids=parent1.tank_ids.copy()
-        )
+        # Create offspring: copy each parent once and swap the middle segment
+        # in place (avoids building three slices and two concatenations per child)
+        genes1 = list(parent1.genes)
+        genes2 = list(parent2.genes)
+        genes1[point1:point2], genes2[point1:point2] = \
+            parent2.genes[point1:point2], parent1.genes[point1:point2]
         
-        offspring2 = Chromosome(
-            genes=parent2.genes[:point1] + parent1.genes[point1:point2] + parent2.genes[point2:],
-            tank_ids=parent2.tank_ids.copy()
-        )
+        offspring1 = Chromosome(genes=genes1, tank_ids=parent1.tank_ids.copy())
+        offspring2 = Chromosome(genes=genes2, tank_ids=parent2.tank_ids.copy())
         
         # Repair offspring
         offspring1 = self._repair_chromosome(offspring1)
@@ -745,40 +769,80 @@ class GeneticOptimizer:
             return plan
         
         # Step 2: Run GA optimization for regular cargos only
+        best_chromosome = self._evolve()
+        
+        # Convert best chromosome to StowagePlan
+        plan = self._chromosome_to_plan(best_chromosome)
+        
+        # Note: Fixed assignments are NOT added here - they are handled by MainWindow
+        # Fixed tanks are already excluded from available_tanks, so algorithm won't use them
+        
+        # Post-processing: Fill empty tanks with remaining cargo
+        plan = self._fill_empty_tanks_with_remaining_cargo(plan, self.settings)
+        
+        return plan
+    
+    def _evolve(self) -> Chromosome:
+        """Run the GA generation loop on regular cargos
+        
+        Returns:
+            Best chromosome found
+        """
         # Create initial population
         population = self.create_initial_population()
         
         # Evaluate fitness for initial population
-        fitness_scores = [self.calculate_fitness(chrom) for chrom in population]
+        fitness_tables = self._fitness_tables
+        fitness_scores = _batch_fitness([chrom.genes for chrom in population], fitness_tables)
         
         # Track best solution
         best_idx = max(range(len(population)), key=lambda i: fitness_scores[i])
         best_chromosome = population[best_idx].copy()
         best_fitness = fitness_scores[best_idx]
-        self.best_fitness_history = [best_fitness]
+        history = self._fitness_history
+        history[0] = best_fitness
+        self._history_len = 1
+        convergence_generations = self.convergence_generations
         
         # Main GA loop
         for generation in range(self.max_generations):
             # Create new population
             new_population = []
             
-            # Elitism: Keep best individuals
+            # Fitness of each new chromosome if already known (None = needs evaluation)
+            new_fitness = []
+            
+            # Elitism: Keep best individuals (their fitness is unchanged)
             if self.use_elitism:
-                sorted_indices = sorted(range(len(population)), 
-                                       key=lambda i: fitness_scores[i], 
-                                       reverse=True)
-                for i in range(min(self.elitism_count, len(population))):
-                    new_population.append(population[sorted_indices[i]].copy())
+                # Partial selection of the top-k (O(n log k) instead of a full sort)
+                elite_indices = heapq.nlargest(self.elitism_count, range(len(population)),
+                                               key=fitness_scores.__getitem__)
+                for i in elite_indices:
+                    new_population.append(population[i].copy())
+                    new_fitness.append(fitness_scores[i])
+            
+            # Select all parents for this generation's offspring in one batch
+            num_pairs = (self.population_size - len(new_population) + 1) // 2
+            parent_indices = self._select_parent_indices(fitness_scores, 2 * num_pairs)
+            
+            # Draw every pair's crossover points in one call (crossover needs
+            # at least 2 genes; with fewer it copies the parents)
+            num_genes = len(self.tank_ids)
+            crossover_points = random.choices(range(num_genes), k=2 * num_pairs) if num_genes >= 2 else None
             
             # Generate offspring until population is filled
-            while len(new_population) < self.population_size:
-                # Selection
-                parent1 = self.tournament_selection(population, fitness_scores)
-                parent2 = self.tournament_selection(population, fitness_scores)
+            for pair in range(num_pairs):
+                # Selection (crossover/mutation build new chromosomes, parents stay intact)
+                parent1 = population[parent_indices[2 * pair]]
+                parent2 = population[parent_indices[2 * pair + 1]]
                 
                 # Crossover
                 if random.random() < self.crossover_rate:
-                    offspring1, offspring2 = self.two_point_crossover(parent1, parent2)
+                    offspring1, offspring2 = self.two_point_crossover(
+                        parent1, parent2,
+                        (crossover_points[2 * pair], crossover_points[2 * pair + 1])
+                        if crossover_points else None
+                    )
                 else:
                     offspring1, offspring2 = parent1.copy(), parent2.copy()
                 
@@ -789,14 +853,22 @@ class GeneticOptimizer:
                     offspring2 = self.mutate(offspring2)
                 
                 new_population.append(offspring1)
+                new_fitness.append(None)
                 if len(new_population) < self.population_size:
                     new_population.append(offspring2)
+                    new_fitness.append(None)
             
             # Trim to population size
             new_population = new_population[:self.population_size]
+            new_fitness = new_fitness[:self.population_size]
             
-            # Evaluate fitness for new population
-            fitness_scores = [self.calculate_fitness(chrom) for chrom in new_population]
+            # Evaluate fitness for new population (only chromosomes not yet scored;
+            # elites keep their known fitness)
+            pending = [i for i, fitness in enumerate(new_fitness) if fitness is None]
+            evaluated = _batch_fitness([new_population[i].genes for i in pending], fitness_tables)
+            for i, fitness in zip(pending, evaluated):
+                new_fitness[i] = fitness
+            fitness_scores = new_fitness
             
             # Update best solution
             current_best_idx = max(range(len(new_population)), 
@@ -807,31 +879,28 @@ class GeneticOptimizer:
                 best_chromosome = new_population[current_best_idx].copy()
                 best_fitness = current_best_fitness
             
-            self.best_fitness_history.append(best_fitness)
+            history[self._history_len] = best_fitness
+            self._history_len += 1
             
-            # Check convergence
-            if len(self.best_fitness_history) >= self.convergence_generations:
+            # Check convergence (O(1): compare against the entry N generations back)
+            if self._history_len >= convergence_generations:
                 recent_improvement = (
-                    self.best_fitness_history[-1] - 
-                    self.best_fitness_history[-self.convergence_generations]
+                    best_fitness - 
+                    history[self._history_len - convergence_generations]
                 )
                 if recent_improvement < self.convergence_threshold:
                     # Converged - no significant improvement
                     break
             
+            # Diversity collapse - every individual has the same fitness, so
+            # selection and crossover can only reproduce the same solutions
+            if current_best_fitness - min(fitness_scores) < 1e-9:
+                break
+            
             # Update population
             population = new_population
         
-        # Convert best chromosome to StowagePlan
-        plan = self._chromosome_to_plan(best_chromosome)
-        
-        # Note: Fixed assignments are NOT added here - they are handled by MainWindow
-        # Fixed tanks are already excluded from available_tanks, so algorithm won't use them
-        
-        # Post-processing: Fill empty tanks with remaining cargo
-        plan = self._fill_empty_tanks_with_remaining_cargo(plan, self.settings)
-        
-        return plan
+        return best_chromosome
     
     def _chromosome_to_plan(self, chromosome: Chromosome) -> StowagePlan:
         """Convert chromosome to StowagePlan
@@ -856,9 +925,6 @@ class GeneticOptimizer:
         # Note: Fixed assignments are NOT added here - they are handled by MainWindow
         # Fixed tanks are already excluded from available_tanks, so they won't be in chromosome
         
-        # Create cargo map for quick lookup
-        cargo_map = {cargo.unique_id: cargo for cargo in self.cargo_requests}
-        
         # Add assignments from chromosome (regular cargos only)
         # Fixed tanks are already excluded from available_tanks, so they won't appear here
         for i, (cargo_id, quantity) in enumerate(chromosome.genes):
@@ -870,7 +936,7 @@ class GeneticOptimizer:
                     continue
                 # Note: Fixed tanks are already excluded from available_tanks, so they won't be in chromosome
                 
-                cargo = cargo_map.get(cargo_id)
+                cargo = self._cargo_map.get(cargo_id)
                 
                 if cargo:
                     assignment = TankAssignment(
@@ -898,13 +964,12 @@ class GeneticOptimizer:
         """
         min_util = settings.get('min_utilization', 0.65)
         
-        # Step 1: Find empty tanks
-        empty_tanks = []
-        for tank in self.available_tanks:
-            if tank.id not in self.excluded_tanks:
-                assignment = plan.get_assignment(tank.id)
-                if assignment is None:
-                    empty_tanks.append(tank)
+        # Step 1: Find empty tanks (track assigned tank IDs in a set for O(1) checks)
+        assigned_tank_ids = set(plan.assignments)
+        empty_tanks = [
+            tank for tank in self.available_tanks
+            if tank.id not in self.excluded_tanks and tank.id not in assigned_tank_ids
+        ]
         
         # If no empty tanks, nothing to do
         if not empty_tanks:
@@ -926,26 +991,26 @@ class GeneticOptimizer:
         # Most needed cargo first
         remaining_cargos.sort(key=lambda x: x[1], reverse=True)
         
+        # Sort empty tanks by volume once (ascending - try smaller tanks first for
+        # better fit); volumes never change, so filtering keeps this order
+        empty_tanks.sort(key=attrgetter('volume'))
+        
         # Step 4: Fill empty tanks with remaining cargo
         # Process each remaining cargo starting with the most needed
         for cargo, remaining_qty in remaining_cargos:
             if remaining_qty < 0.001:
                 continue
             
-            # Sort empty tanks by volume (ascending for best fit)
-            # Try to find tanks that fit well
-            available_empty_tanks = [
+            # Drop tanks filled by previous cargos (order is preserved)
+            empty_tanks = [
                 tank for tank in empty_tanks
-                if plan.get_assignment(tank.id) is None
+                if tank.id not in assigned_tank_ids
             ]
             
-            if not available_empty_tanks:
+            if not empty_tanks:
                 break
             
-            # Sort by volume (ascending - try smaller tanks first for better fit)
-            available_empty_tanks.sort(key=lambda t: t.volume)
-            
-            for tank in available_empty_tanks:
+            for tank in empty_tanks:
                 if remaining_qty < 0.001:
                     break
                 
@@ -963,6 +1028,7 @@ class GeneticOptimizer:
                     quantity_loaded=qty_to_place
                 )
                 plan.add_assignment(tank.id, assignment)
+                assigned_tank_ids.add(tank.id)
                 remaining_qty -= qty_to_place
         
         return plan
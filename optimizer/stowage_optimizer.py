@@ -1,12 +1,37 @@
 """Stowage plan optimization algorithm"""
 
-from typing import List, Dict, Optional, Tuple, Callable
+from typing import List, Optional, Tuple, Callable
 from models.ship import Ship, Tank
 from models.cargo import Cargo
 from models.plan import StowagePlan, TankAssignment
+from bisect import bisect_left, insort
+from functools import lru_cache, partial
+from operator import itemgetter
 import random
 
 
+# Cargo sort keys for optimize_multiple, sorted descending. They read a cargo's
+# precomputed sort fields:
+# (quantity, receiver_count, cargo_type_hash, -quantity, -receiver_count)
+_key_quantity_then_receivers = itemgetter(0, 4)       # Quantity large first, then fewer receivers
+_key_quantity_asc_then_receivers = itemgetter(3, 4)   # Quantity small first, then fewer receivers
+_key_receivers_then_quantity = itemgetter(1, 0)       # More receivers first, then quantity
+_key_receivers_asc_then_quantity = itemgetter(4, 0)   # Fewer receivers first, then quantity
+_key_quantity = itemgetter(0)                         # Quantity large first
+_key_quantity_asc = itemgetter(3)                     # Quantity small first
+
+
+@lru_cache(maxsize=4096)
+def _random_rank(seed: int, cargo_type_hash: int) -> float:
+    """Seeded random rank of a cargo type (cached, seeding a Random is costly)"""
+    return random.Random(seed + cargo_type_hash).random()
+
+
+def _key_random(seed: int, f: tuple) -> tuple:
+    """Random order per cargo type (stable for a given seed), then quantity"""
+    return (_random_rank(seed, f[2]), f[0], f[1])
+
+
 class StowageOptimizer:
     """Optimizes cargo loading into ship tanks"""
     
@@ -17,9 +42,8 @@ class StowageOptimizer:
         Improved Algorithm:
         1. Sort cargo by priority (largest quantity first, then by receiver count)
         2. For each cargo, use smart tank selection:
-           - First try: Find exact-fit tank (minimal waste)
-           - Second try: Find best-fit tank (smallest that fits)
-           - Third try: Use largest available tank for partial fill
+           - First try: Find exact-fit tank (minimal waste, at least 65% full)
+           - Second try: Use largest available tank for partial fill
         3. Maximize tank utilization by minimizing leftover space
         4. Handle multiple receivers by distributing across tanks
         
@@ -30,6 +54,56 @@ class StowageOptimizer:
         Returns:
             StowagePlan with optimized assignments
         """
+        # Smart sorting: by quantity (largest first), then by receiver count
+        # This prioritizes large cargoes and single-receiver cargoes
+        sorted_cargo = sorted(
+            cargo_requests, 
+            key=lambda c: (c.quantity, -len(c.receivers) if c.receivers else 0),
+            reverse=True
+        )
+        
+        return StowageOptimizer._optimize_presorted(ship, cargo_requests, sorted_cargo, excluded_tanks)
+    
+    @staticmethod
+    def _optimize_presorted(ship: Ship, cargo_requests: List[Cargo], sorted_cargo: List[Cargo],
+                            excluded_tanks: Optional[set[str]] = None) -> StowagePlan:
+        """Place cargo into tanks in the given order (shared greedy loop)
+        
+        Args:
+            ship: Ship with tank configuration
+            cargo_requests: Original cargo requests stored on the plan
+            sorted_cargo: Same cargo in the order it should be placed
+            excluded_tanks: Set of tank IDs to exclude from planning
+            
+        Returns:
+            StowagePlan with greedy assignments
+        """
+        tank_ids, tank_volumes, sorted_volumes = StowageOptimizer._tank_layout(ship, excluded_tanks)
+        placements = StowageOptimizer._greedy_placements(
+            tank_volumes, sorted_volumes, [cargo.quantity for cargo in sorted_cargo]
+        )
+        return StowageOptimizer._build_plan(ship, cargo_requests, tank_ids, sorted_cargo, placements)
+    
+    @staticmethod
+    def _tank_layout(ship: Ship, excluded_tanks: Optional[set[str]] = None
+                     ) -> Tuple[List[str], List[float], List[Tuple[float, int]]]:
+        """Get the tanks open for planning as (tank_ids, tank_volumes, sorted_volumes)
+        
+        The greedy loop addresses tanks by their index in the first two lists;
+        sorted_volumes holds (volume, tank_index) in ascending order. None of
+        these are modified, so one layout can be shared by several runs.
+        """
+        # Exclude tanks that are marked as excluded from planning
+        excluded = excluded_tanks or set()
+        tanks = [tank for tank in ship.tanks if tank.id not in excluded]
+        tank_volumes = [tank.volume for tank in tanks]
+        sorted_volumes = sorted((volume, i) for i, volume in enumerate(tank_volumes))
+        return [tank.id for tank in tanks], tank_volumes, sorted_volumes
+    
+    @staticmethod
+    def _build_plan(ship: Ship, cargo_requests: List[Cargo], tank_ids: List[str],
+                    sorted_cargo: List[Cargo], placements: List[Tuple[int, int, float]]) -> StowagePlan:
+        """Turn (tank_index, position, quantity) placements into a StowagePlan"""
         plan = StowagePlan(
             ship_name=ship.name,
             ship_profile_id=ship.id,
@@ -37,170 +111,201 @@ class StowageOptimizer:
             plan_name="Yeni Plan"
         )
         
-        # Create a copy of tanks for tracking available capacity
-        # Exclude tanks that are marked as excluded from planning
-        excluded = excluded_tanks or set()
-        available_tanks = {tank.id: tank.volume for tank in ship.tanks if tank.id not in excluded}
+        for tank_index, position, quantity_loaded in placements:
+            tank_id = tank_ids[tank_index]
+            assignment = TankAssignment(
+                tank_id=tank_id,
+                cargo=sorted_cargo[position],
+                quantity_loaded=quantity_loaded
+            )
+            plan.add_assignment(tank_id, assignment)
         
-        # Smart sorting: by quantity (largest first), then by receiver count
-        # This prioritizes large cargoes and single-receiver cargoes
-        sorted_cargo = sorted(
-            cargo_requests, 
-            key=lambda c: (c.quantity, -len(c.receivers) if c.receivers else 0),
-            reverse=True
-        )
+        return plan
+    
+    @staticmethod
+    def _greedy_placements(tank_volumes: List[float], sorted_volumes: List[Tuple[float, int]],
+                           quantities: List[float], first_fit: bool = False) -> List[Tuple[int, int, float]]:
+        """Greedy placement loop on plain numbers (picklable for worker processes)
+        
+        Args:
+            tank_volumes: Full capacity of each tank open for planning
+            sorted_volumes: (volume, tank_index) sorted ascending, see _tank_layout
+            quantities: Cargo quantities in placement order
+            first_fit: Take the first suitable tank in ship order instead of
+                scoring exact-fit and best-fit candidates
+            
+        Returns:
+            List of (tank_index, position in quantities, quantity_loaded)
+        """
+        placements = []
+        
+        # Create a copy of tanks for tracking available capacity
+        available = list(tank_volumes)
+        # Available volumes kept sorted as (volume, tank_index) so candidate
+        # tanks can be found by bisection; the index keeps ship-order tie-breaking
+        sorted_available = list(sorted_volumes)
         
         # Process each cargo request
-        for cargo in sorted_cargo:
-            remaining_quantity = cargo.quantity
+        for position, quantity in enumerate(quantities):
+            remaining_quantity = quantity
             
             # Distribute this cargo across multiple tanks if needed
             while remaining_quantity > 0.001:  # Small tolerance for floating point
-                # Strategy 1: Try to find exact-fit or near-exact-fit tank (waste < 1%)
-                best_tank_id, waste_ratio = StowageOptimizer._find_optimal_tank(
-                    remaining_quantity, available_tanks, ship, prefer_exact_fit=True
-                )
-                
-                if best_tank_id is None:
-                    # Strategy 2: Find best-fit tank (minimal waste)
-                    best_tank_id, _ = StowageOptimizer._find_optimal_tank(
-                        remaining_quantity, available_tanks, ship, prefer_exact_fit=False
+                if first_fit:
+                    # First-fit: first tank in ship order that the quantity fills to 65%
+                    best_tank = StowageOptimizer._find_first_fit_tank(
+                        remaining_quantity, sorted_available, tank_volumes
+                    )
+                else:
+                    # Strategy 1: Try to find exact-fit or near-exact-fit tank (waste < 1%).
+                    # Exact-fit and best-fit accept the same tanks and only rank them
+                    # differently, so when this finds nothing a best-fit search can't either
+                    best_tank, waste_ratio = StowageOptimizer._find_optimal_tank(
+                        remaining_quantity, sorted_available, tank_volumes, prefer_exact_fit=True
                     )
                 
-                if best_tank_id is None:
-                    # Strategy 3: Use largest available tank (may result in partial fill)
-                    best_tank_id = StowageOptimizer._find_largest_available_tank(available_tanks, ship)
-                    if best_tank_id is None:
+                if best_tank is None:
+                    # Strategy 2: Use largest available tank (may result in partial fill)
+                    best_tank = StowageOptimizer._find_largest_available_tank(sorted_available)
+                    if best_tank is None:
                         # Cannot fulfill this cargo - break and report partial fulfillment
                         break
                 
-                tank = ship.get_tank_by_id(best_tank_id)
-                quantity_to_load = min(remaining_quantity, available_tanks[best_tank_id])
+                tank_volume = tank_volumes[best_tank]
+                quantity_to_load = min(remaining_quantity, available[best_tank])
                 
                 # Check minimum utilization constraint: tank must be at least 65% filled
-                tank_utilization = quantity_to_load / tank.volume if tank.volume > 0 else 0
+                tank_utilization = quantity_to_load / tank_volume if tank_volume > 0 else 0
                 
                 if tank_utilization < 0.65:
-                    # This tank would be less than 65% full - skip it and try to find another
-                    # Remove this tank from consideration temporarily
-                    original_volume = available_tanks[best_tank_id]
-                    available_tanks[best_tank_id] = 0  # Mark as unavailable
-                    
-                    # Try to find another tank
-                    alt_tank_id = StowageOptimizer._find_optimal_tank(
-                        remaining_quantity, available_tanks, ship, prefer_exact_fit=False
-                    )[0]
-                    
-                    if alt_tank_id:
-                        # Found another tank, restore original and use alternative
-                        available_tanks[best_tank_id] = original_volume
-                        best_tank_id = alt_tank_id
-                        tank = ship.get_tank_by_id(best_tank_id)
-                        quantity_to_load = min(remaining_quantity, available_tanks[best_tank_id])
-                        tank_utilization = quantity_to_load / tank.volume if tank.volume > 0 else 0
-                    else:
-                        # No suitable tank found that meets 65% constraint
-                        available_tanks[best_tank_id] = original_volume  # Restore
-                        break  # Skip this cargo, leave tank empty
-                
-                # If we still have a valid tank and it meets the constraint
-                if tank_utilization >= 0.65:
-                    # Create assignment
-                    assignment = TankAssignment(
-                        tank_id=best_tank_id,
-                        cargo=cargo,
-                        quantity_loaded=quantity_to_load
-                    )
-                    plan.add_assignment(best_tank_id, assignment)
-                    
-                    # Update available capacity
-                    available_tanks[best_tank_id] -= quantity_to_load
-                    remaining_quantity -= quantity_to_load
-                else:
-                    # Cannot place in any tank meeting 65% constraint
+                    # This tank would be less than 65% full. Every tank that could take
+                    # the quantity at 65% was already ruled out by the searches above,
+                    # so no alternative exists - skip this cargo, leave tank empty
                     break
+                
+                # Record assignment
+                placements.append((best_tank, position, quantity_to_load))
+                
+                # Update available capacity
+                StowageOptimizer._set_available(
+                    available, sorted_available, best_tank,
+                    available[best_tank] - quantity_to_load
+                )
+                remaining_quantity -= quantity_to_load
         
-        return plan
+        return placements
     
     @staticmethod
-    def _find_optimal_tank(quantity: float, available_tanks: Dict[str, float], 
-                           ship: Ship, prefer_exact_fit: bool = False) -> Tuple[Optional[str], float]:
+    def _find_optimal_tank(quantity: float, sorted_available: List[Tuple[float, int]], 
+                           tank_volumes: List[float],
+                           prefer_exact_fit: bool = False) -> Tuple[Optional[int], float]:
         """Find the optimal tank for the quantity
         
         Args:
             quantity: Quantity to place
-            available_tanks: Dictionary of tank_id -> available_volume
-            ship: Ship object
+            sorted_available: Sorted list of (available_volume, tank_index)
+            tank_volumes: Full tank capacity by tank index
             prefer_exact_fit: If True, prefer tanks with minimal waste (<1%)
         
         Returns:
-            Tuple of (tank_id, waste_ratio) or (None, 1.0) if no tank found
+            Tuple of (tank_index, waste_ratio) or (None, 1.0) if no tank found
             waste_ratio = leftover_volume / tank_volume
             
         Note:
             Only considers tanks where quantity will fill at least 65% of the tank capacity
         """
         MIN_UTILIZATION = 0.65  # Minimum 65% tank utilization requirement
-        best_tank_id = None
+        best_tank = None
         best_score = float('inf')
         best_waste_ratio = 1.0
         
-        for tank_id, available_volume in available_tanks.items():
-            if available_volume < quantity:
-                continue  # Tank too small for quantity
-            
-            # Get full tank capacity
-            tank = ship.get_tank_by_id(tank_id)
-            if not tank:
-                continue
+        # A tank can only reach 65% utilization if its available volume is at
+        # most quantity / 0.65 (available never exceeds capacity), so only the
+        # slice of tanks between quantity and that bound needs scoring.
+        # Within it capacity >= available >= quantity > 0, so no zero checks
+        max_available = quantity / MIN_UTILIZATION * 1.000001
+        start = bisect_left(sorted_available, (quantity,))
+        
+        for available_volume, tank_index in sorted_available[start:]:
+            if available_volume > max_available:
+                break
             
             # Calculate utilization (quantity / full tank capacity)
-            utilization = quantity / tank.volume if tank.volume > 0 else 0
+            utilization = quantity / tank_volumes[tank_index]
             
             # Skip tanks that would be less than 65% full
             if utilization < MIN_UTILIZATION:
                 continue
             
-            waste = available_volume - quantity
-            waste_ratio = waste / available_volume if available_volume > 0 else 1.0
+            waste_ratio = (available_volume - quantity) / available_volume
             
-            # Score calculation: prefer higher utilization and lower waste
             if prefer_exact_fit:
-                # For exact fit preference: heavily penalize waste > 1%
-                if waste_ratio <= 0.01:
-                    # Exact or near-exact fit - prefer this
-                    score = waste_ratio * 0.1  # Very low score for exact fits
-                else:
-                    score = waste_ratio * 100  # High penalty for non-exact fits
-            else:
-                # For best-fit: balance between utilization and waste
-                # Lower score = better choice
-                score = waste_ratio + (1 - utilization) * 0.5
+                # Candidates come in increasing available volume, i.e. increasing
+                # waste ratio, and the exact-fit score only depends on it: the
+                # first eligible tank is the best one
+                return tank_index, waste_ratio
+            
+            # For best-fit: balance between utilization and waste
+            # Lower score = better choice
+            score = waste_ratio + (1 - utilization) * 0.5
             
-            if score < best_score:
+            # Equal scores go to the tank listed first on the ship
+            if score < best_score or (score == best_score and tank_index < best_tank):
                 best_score = score
-                best_tank_id = tank_id
+                best_tank = tank_index
                 best_waste_ratio = waste_ratio
         
-        return best_tank_id, best_waste_ratio
+        return best_tank, best_waste_ratio
+    
+    @staticmethod
+    def _find_first_fit_tank(quantity: float, sorted_available: List[Tuple[float, int]],
+                             tank_volumes: List[float]) -> Optional[int]:
+        """Find the first tank in ship order that takes the quantity at 65% utilization
+        
+        Returns:
+            Tank index or None if no tank qualifies
+        """
+        MIN_UTILIZATION = 0.65  # Minimum 65% tank utilization requirement
+        first_tank = None
+        
+        # Same candidate window as _find_optimal_tank, no scoring needed
+        max_available = quantity / MIN_UTILIZATION * 1.000001
+        start = bisect_left(sorted_available, (quantity,))
+        
+        for available_volume, tank_index in sorted_available[start:]:
+            if available_volume > max_available:
+                break
+            if first_tank is not None and tank_index > first_tank:
+                continue
+            if quantity / tank_volumes[tank_index] >= MIN_UTILIZATION:
+                first_tank = tank_index
+        
+        return first_tank
     
     @staticmethod
-    def _find_largest_available_tank(available_tanks: Dict[str, float], 
-                                    ship: Ship) -> Optional[str]:
+    def _find_largest_available_tank(sorted_available: List[Tuple[float, int]]) -> Optional[int]:
         """Find the largest available tank
         
         Returns:
-            Tank ID or None if no tanks available
+            Tank index or None if no tanks available
         """
-        best_tank_id = None
-        max_volume = 0
+        if not sorted_available:
+            return None
         
-        for tank_id, available_volume in available_tanks.items():
-            if available_volume > max_volume and available_volume > 0.001:
-                max_volume = available_volume
-                best_tank_id = tank_id
+        max_volume = sorted_available[-1][0]
+        if max_volume <= 0.001:
+            return None
         
-        return best_tank_id
+        # First tank (in ship order) among those with the largest volume
+        return sorted_available[bisect_left(sorted_available, (max_volume,))][1]
+    
+    @staticmethod
+    def _set_available(available: List[float], sorted_available: List[Tuple[float, int]],
+                       tank_index: int, volume: float) -> None:
+        """Update a tank's available volume in both the list and the sorted list"""
+        del sorted_available[bisect_left(sorted_available, (available[tank_index], tank_index))]
+        available[tank_index] = volume
+        insort(sorted_available, (volume, tank_index))
     
     @staticmethod
     def validate_plan(ship: Ship, cargo_requests: List[Cargo]) -> tuple[bool, str]:
@@ -209,7 +314,9 @@ class StowageOptimizer:
         Returns:
             (is_valid, error_message)
         """
-        total_cargo_quantity = sum(cargo.quantity for cargo in cargo_requests)
+        total_cargo_quantity = 0.0
+        for cargo in cargo_requests:
+            total_cargo_quantity += cargo.quantity
         total_capacity = ship.get_total_capacity()
         
         if total_cargo_quantity > total_capacity:
@@ -273,19 +380,24 @@ class StowageOptimizer:
         tank_utilization = (total_loaded / total_capacity * 100) if total_capacity > 0 else 0
         utilization_score = tank_utilization * 0.3
         
-        # 3. Average fill rate (0-20 points)
-        fill_rates = []
+        # Fill rates and empty tanks for factors 3 and 4, in one pass over the tanks
+        assignments = plan.assignments
+        fill_rate_sum = 0.0
+        filled_tanks = 0
+        empty_tanks = 0
         for tank in ship.tanks:
-            assignment = plan.get_assignment(tank.id)
-            if assignment:
-                fill_rate = (assignment.quantity_loaded / tank.volume * 100) if tank.volume > 0 else 0
-                fill_rates.append(fill_rate)
+            assignment = assignments.get(tank.id)
+            if assignment is None:
+                empty_tanks += 1
+            else:
+                fill_rate_sum += (assignment.quantity_loaded / tank.volume * 100) if tank.volume > 0 else 0
+                filled_tanks += 1
         
-        avg_fill_rate = sum(fill_rates) / len(fill_rates) if fill_rates else 0
+        # 3. Average fill rate (0-20 points)
+        avg_fill_rate = fill_rate_sum / filled_tanks if filled_tanks else 0
         fill_score = avg_fill_rate * 0.2
         
         # 4. Empty space penalty (0-10 points deducted)
-        empty_tanks = sum(1 for tank in ship.tanks if plan.get_assignment(tank.id) is None)
         empty_penalty = (empty_tanks / len(ship.tanks) * 100) * 0.1
         empty_score = 10.0 - empty_penalty  # Max 10 points, reduced by penalty
         
@@ -309,20 +421,45 @@ class StowageOptimizer:
         strategies = StowageOptimizer._get_cargo_sort_strategies(num_solutions)
         solutions = []
         
-        for strategy_name, sort_key_func in strategies:
+        # Sort fields are computed once per cargo and shared by every strategy;
+        # the negated copies let fixed strategies use plain itemgetter keys
+        sort_fields = []
+        for c in cargo_requests:
+            receiver_count = len(c.receivers) if c.receivers else 0
+            sort_fields.append(
+                (c.quantity, receiver_count, hash(c.cargo_type), -c.quantity, -receiver_count)
+            )
+        indices = range(len(cargo_requests))
+        tank_ids, tank_volumes, sorted_volumes = StowageOptimizer._tank_layout(ship, excluded_tanks)
+        
+        seen_orders = set()
+        for strategy_name, sort_key_func, first_fit in strategies:
             try:
-                plan = StowageOptimizer.optimize_with_sort(ship, cargo_requests, sort_key_func, excluded_tanks)
-                score = StowageOptimizer.score_plan(plan, ship)
-                solutions.append((plan, score, strategy_name))
-            except Exception as e:
+                keys = list(map(sort_key_func, sort_fields))
+            except Exception:
                 # Skip failed strategies
                 continue
+            order = tuple(sorted(indices, key=keys.__getitem__, reverse=True))
+            # Strategies that end up with the same cargo order (e.g. all receiver
+            # counts equal) build the same plan, which would be dropped as a
+            # duplicate of the first one anyway - don't run them
+            if (order, first_fit) in seen_orders:
+                continue
+            seen_orders.add((order, first_fit))
+            
+            sorted_cargo = [cargo_requests[i] for i in order]
+            placements = StowageOptimizer._greedy_placements(
+                tank_volumes, sorted_volumes, [cargo.quantity for cargo in sorted_cargo], first_fit
+            )
+            plan = StowageOptimizer._build_plan(ship, cargo_requests, tank_ids, sorted_cargo, placements)
+            score = StowageOptimizer.score_plan(plan, ship)
+            solutions.append((plan, score, strategy_name))
         
         # Remove duplicates (same assignments)
         unique_solutions = StowageOptimizer._remove_duplicate_plans(solutions)
         
         # Sort by score (best first)
-        unique_solutions.sort(key=lambda x: x[1], reverse=True)
+        unique_solutions.sort(key=itemgetter(1), reverse=True)
         
         return unique_solutions
     
@@ -340,122 +477,65 @@ class StowageOptimizer:
         Returns:
             StowagePlan with optimized assignments
         """
-        plan = StowagePlan(
-            ship_name=ship.name,
-            ship_profile_id=ship.id,
-            cargo_requests=cargo_requests,
-            plan_name="Yeni Plan"
-        )
-        
-        # Create a copy of tanks for tracking available capacity
-        # Exclude tanks that are marked as excluded from planning
-        excluded = excluded_tanks or set()
-        available_tanks = {tank.id: tank.volume for tank in ship.tanks if tank.id not in excluded}
-        
         # Sort cargo using provided strategy
         sorted_cargo = sorted(cargo_requests, key=sort_key_func, reverse=True)
         
-        # Process each cargo request (same logic as optimize())
-        for cargo in sorted_cargo:
-            remaining_quantity = cargo.quantity
-            
-            while remaining_quantity > 0.001:
-                best_tank_id, waste_ratio = StowageOptimizer._find_optimal_tank(
-                    remaining_quantity, available_tanks, ship, prefer_exact_fit=True
-                )
-                
-                if best_tank_id is None:
-                    best_tank_id, _ = StowageOptimizer._find_optimal_tank(
-                        remaining_quantity, available_tanks, ship, prefer_exact_fit=False
-                    )
-                
-                if best_tank_id is None:
-                    best_tank_id = StowageOptimizer._find_largest_available_tank(available_tanks, ship)
-                    if best_tank_id is None:
-                        break
-                
-                tank = ship.get_tank_by_id(best_tank_id)
-                quantity_to_load = min(remaining_quantity, available_tanks[best_tank_id])
-                
-                # Check minimum utilization constraint
-                tank_utilization = quantity_to_load / tank.volume if tank.volume > 0 else 0
-                
-                if tank_utilization < 0.65:
-                    original_volume = available_tanks[best_tank_id]
-                    available_tanks[best_tank_id] = 0
-                    
-                    alt_tank_id = StowageOptimizer._find_optimal_tank(
-                        remaining_quantity, available_tanks, ship, prefer_exact_fit=False
-                    )[0]
-                    
-                    if alt_tank_id:
-                        available_tanks[best_tank_id] = original_volume
-                        best_tank_id = alt_tank_id
-                        tank = ship.get_tank_by_id(best_tank_id)
-                        quantity_to_load = min(remaining_quantity, available_tanks[best_tank_id])
-                        tank_utilization = quantity_to_load / tank.volume if tank.volume > 0 else 0
-                    else:
-                        available_tanks[best_tank_id] = original_volume
-                        break
-                
-                if tank_utilization >= 0.65:
-                    assignment = TankAssignment(
-                        tank_id=best_tank_id,
-                        cargo=cargo,
-                        quantity_loaded=quantity_to_load
-                    )
-                    plan.add_assignment(best_tank_id, assignment)
-                    available_tanks[best_tank_id] -= quantity_to_load
-                    remaining_quantity -= quantity_to_load
-                else:
-                    break
-        
-        return plan
+        return StowageOptimizer._optimize_presorted(ship, cargo_requests, sorted_cargo, excluded_tanks)
     
     @staticmethod
-    def _get_cargo_sort_strategies(num: int) -> List[Tuple[str, Callable]]:
+    def _get_cargo_sort_strategies(num: int) -> List[Tuple[str, Callable, bool]]:
         """Get different cargo sorting strategies
         
+        Sort key functions take a cargo's precomputed sort fields,
+        see optimize_multiple. For num > 6 a first-fit decreasing strategy is
+        added on top of the num sort strategies, so num + 1 are returned.
+        
         Returns:
-            List of (strategy_name, sort_key_function) tuples
+            List of (strategy_name, sort_key_function, first_fit) tuples
         """
         strategies = []
         
         # Strategy 1: Quantity large first, then receiver count (default)
         strategies.append((
             "Miktar (Büyük→Küçük) + Alıcı",
-            lambda c: (c.quantity, -len(c.receivers) if c.receivers else 0)
+            _key_quantity_then_receivers,
+            False
         ))
         
         # Strategy 2: Quantity small first, then receiver count
         strategies.append((
             "Miktar (Küçük→Büyük) + Alıcı",
-            lambda c: (-c.quantity, -len(c.receivers) if c.receivers else 0)
+            _key_quantity_asc_then_receivers,
+            False
         ))
         
         # Strategy 3: Receiver count (few first), then quantity
         strategies.append((
             "Alıcı Sayısı (Az→Çok) + Miktar",
-            lambda c: (len(c.receivers) if c.receivers else 0, c.quantity)
+            _key_receivers_then_quantity,
+            False
         ))
         
         # Strategy 4: Receiver count (many first), then quantity
         strategies.append((
             "Alıcı Sayısı (Çok→Az) + Miktar",
-            lambda c: (-len(c.receivers) if c.receivers else 0, c.quantity)
+            _key_receivers_asc_then_quantity,
+            False
         ))
         
         # Strategy 5: Pure quantity (large first)
         strategies.append((
             "Sadece Miktar (Büyük→Küçük)",
-            lambda c: c.quantity
+            _key_quantity,
+            False
         ))
         
         # Strategy 6: Pure quantity (small first)
         if num > 5:
             strategies.append((
                 "Sadece Miktar (Küçük→Büyük)",
-                lambda c: -c.quantity
+                _key_quantity_asc,
+                False
             ))
         
         # Strategy 7-10: Random variations with different priorities
@@ -463,14 +543,22 @@ class StowageOptimizer:
             random_seed = i + 1000
             strategies.append((
                 f"Rastgele Strateji {i+1}",
-                lambda c, seed=random_seed: (
-                    random.Random(seed + hash(c.cargo_type)).random(),
-                    c.quantity,
-                    len(c.receivers) if c.receivers else 0
-                )
+                partial(_key_random, random_seed),
+                False
             ))
         
-        return strategies[:num]
+        strategies = strategies[:num]
+        
+        # Extra candidate on top of the num strategies above: quantity large
+        # first with first-fit placement (first-fit decreasing)
+        if num > 6:
+            strategies.append((
+                "Miktar (Büyük→Küçük) + İlk Uygun Tank",
+                _key_quantity_then_receivers,
+                True
+            ))
+        
+        return strategies
     
     @staticmethod
     def _remove_duplicate_plans(solutions: List[Tuple[StowagePlan, float, str]]) -> List[Tuple[StowagePlan, float, str]]:
@@ -482,27 +570,23 @@ class StowageOptimizer:
         Returns:
             List with duplicates removed, keeping best score for each unique plan
         """
-        seen = {}
-        unique = []
+        best = {}
         
-        for plan, score, strategy in solutions:
+        for solution in solutions:
+            plan, score, strategy = solution
             # Create signature from assignments
             assignments_sig = tuple(sorted(
                 (tank_id, assignment.cargo.cargo_type, round(assignment.quantity_loaded, 2))
                 for tank_id, assignment in plan.assignments.items()
             ))
             
-            if assignments_sig not in seen:
-                seen[assignments_sig] = (plan, score, strategy)
-                unique.append((plan, score, strategy))
-            else:
-                # If this solution has better score, replace
-                existing_score = seen[assignments_sig][1]
-                if score > existing_score:
-                    # Remove old and add new
-                    unique = [s for s in unique if s[0] != seen[assignments_sig][0]]
-                    seen[assignments_sig] = (plan, score, strategy)
-                    unique.append((plan, score, strategy))
-        
-        return unique
+            existing = best.get(assignments_sig)
+            if existing is None:
+                best[assignments_sig] = solution
+            elif score > existing[1]:
+                # Better score replaces the old entry and moves it to the end
+                del best[assignments_sig]
+                best[assignments_sig] = solution
+        
+        return list(best.values())
 
@@ -1,8 +1,11 @@
 """Storage manager for ship profiles and stowage plans"""
 
+import copy
 import json
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict
 from datetime import datetime
@@ -10,12 +13,113 @@ from datetime import datetime
 from models.ship import Ship
 from models.plan import StowagePlan
 
+try:
+    import orjson  # Optional, several times faster than the json module
+except ImportError:
+    orjson = None
 
+
+def _read_json(path) -> object:
+    """Read and parse a JSON file (with orjson when available)"""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+@lru_cache(maxsize=128)
+def _read_plan_data(path: str, stamp: tuple) -> dict:
+    """Parsed contents of a plan file as of the given file stamp
+    
+    Cached: a changed file gets a new stamp and is read again. The result is
+    shared between calls, so it must only be passed to StowagePlan.from_dict.
+    """
+    return _read_json(path)
+
+
+def _write_json(path, obj, pretty: bool = False) -> None:
+    """Write obj to a JSON file as UTF-8 (with orjson when available)
+    
+    Files the application keeps for itself are written compact; pretty=True
+    indents the output, for files exported to a user-chosen location.
+    The data goes to a temporary file that then replaces path, so readers
+    and crashes never see a half-written file.
+    """
+    # Serialize before opening so a failure does not leave a truncated file
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= orjson.OPT_INDENT_2
+        data = orjson.dumps(obj, option=option)
+    elif pretty:
+        data = json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+    else:
+        data = json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    tmp_path = f"{path}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+# Default optimization settings; copied by get_default_settings, never mutated
+_DEFAULT_SETTINGS = {
+    'optimization_algorithm': 'genetic',  # Default: Genetic Algorithm
+    'min_utilization': 0.65,
+    'drag_drop_warning_threshold': 0.70,
+    'score_weights': {
+        'single_fit': 0.40,
+        'symmetry': 0.25,
+        'bow_stern': 0.15,
+        'best_fit': 0.20
+    },
+    'waste_utilization_weights': {
+        'waste': 0.7,
+        'utilization': 0.3
+    },
+    'exact_fit_threshold': 0.01,
+    'bow_stern_violation_threshold': 3,
+    'symmetric_pair_min_threshold': 0.65,
+    # FAZ tolerance parameters
+    'faz1_single_tank_tolerance': 0.05,
+    'faz2_two_tank_tolerance': 0.05,
+    'faz2_asymmetric_tolerance_factor': 0.2,
+    'faz3_three_tank_tolerance': 0.04,
+    'faz4_four_tank_tolerance': 0.04,
+    'faz5_five_tank_tolerance': 0.04,
+    'mandatory_retry_increment': 0.01,
+    'mandatory_max_relaxation': 0.35,
+    # Genetic Algorithm parameters
+    'ga_population_size': 500,
+    'ga_max_generations': 2000,
+    'ga_crossover_rate': 0.90,
+    'ga_mutation_rate': 0.11,
+    'ga_tournament_size': 3,
+    'ga_use_elitism': True,
+    'ga_elitism_count': 5,
+    'ga_symmetry_penalty_coef': 3000.0,
+    'ga_trim_penalty_coef': 1500.0,
+    'ga_operational_penalty_coef': 100.0,
+    'ga_receiver_tolerance': 0.03,
+    'ga_convergence_threshold': 0.0001,
+    'ga_convergence_generations': 60
+}
+
+
+@lru_cache(maxsize=1)
 def get_base_dir() -> Path:
     """Get the base directory for storage.
     
     In PyInstaller onefile mode, returns the directory where the EXE is located.
     Otherwise, returns the current working directory.
+    Computed once per process; the application never changes directory.
     """
     # Check if running as PyInstaller bundle
     if getattr(sys, 'frozen', False) and hasattr(sys, '_MEIPASS'):
@@ -57,8 +161,17 @@ class StorageManager:
         self.base_dir = Path(base_dir)
         self.profiles_file = self.base_dir / "storage" / "ship_profiles.json"
         self.plans_dir = self.base_dir / "storage" / "saved_plans"
+        self.plans_index_file = self.plans_dir / "_index.json"
+        # String form for the per-plan paths built on every save/load/delete
+        self._plans_dir_str = str(self.plans_dir)
         self.settings_file = self.base_dir / "storage" / "optimization_settings.json"
         
+        # Parsed profiles / merged settings, with the file stamp they were read at
+        self._profiles_cache = None
+        self._settings_cache = None
+        # Plan file name -> summary entry, mirrors plans_index_file once read
+        self._plans_index = None
+        
         # Create directories if they don't exist
         self.profiles_file.parent.mkdir(parents=True, exist_ok=True)
         self.plans_dir.mkdir(parents=True, exist_ok=True)
@@ -92,13 +205,19 @@ class StorageManager:
             return None
     
     def load_all_profiles(self) -> Dict[str, dict]:
-        """Load all ship profiles as dictionary"""
+        """Load all ship profiles as dictionary
+        
+        The parsed file is cached until its modification time or size changes.
+        """
         try:
-            if not self.profiles_file.exists():
+            try:
+                stamp = self._file_stamp(self.profiles_file)
+            except FileNotFoundError:
                 return {}
             
-            with open(self.profiles_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            if self._profiles_cache is None or self._profiles_cache[0] != stamp:
+                self._profiles_cache = (stamp, _read_json(self.profiles_file))
+            return dict(self._profiles_cache[1])
         except Exception as e:
             print(f"Error loading profiles: {e}")
             return {}
@@ -106,7 +225,7 @@ class StorageManager:
     def get_all_ships(self) -> List[Ship]:
         """Get all ship profiles as Ship objects"""
         profiles = self.load_all_profiles()
-        return [Ship.from_dict(data) for data in profiles.values()]
+        return list(map(Ship.from_dict, profiles.values()))
     
     def delete_ship_profile(self, ship_id: str) -> bool:
         """Delete a ship profile"""
@@ -136,8 +255,7 @@ class StorageManager:
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(ship.to_dict(), f, indent=2, ensure_ascii=False)
+            _write_json(file_path, ship.to_dict(), pretty=True)
             return True
         except Exception as e:
             print(f"Error saving ship profile to file: {e}")
@@ -158,17 +276,21 @@ class StorageManager:
             if not file_path.exists():
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return Ship.from_dict(data)
+            return Ship.from_dict(_read_json(file_path))
         except Exception as e:
             print(f"Error loading ship profile from file: {e}")
             return None
     
     def _save_profiles(self, profiles: Dict[str, dict]):
         """Internal method to save profiles to file"""
-        with open(self.profiles_file, 'w', encoding='utf-8') as f:
-            json.dump(profiles, f, indent=2, ensure_ascii=False)
+        _write_json(self.profiles_file, profiles)
+        self._profiles_cache = (self._file_stamp(self.profiles_file), dict(profiles))
+    
+    @staticmethod
+    def _file_stamp(path) -> tuple:
+        """Get (mtime_ns, size) of a file, to tell whether a cached parse is stale"""
+        stat = os.stat(path)
+        return (stat.st_mtime_ns, stat.st_size)
     
     # Stowage Plan Methods
     
@@ -176,10 +298,10 @@ class StorageManager:
         """Save a stowage plan to archive"""
         try:
             filename = f"{plan.id}.json"
-            filepath = self.plans_dir / filename
+            filepath = os.path.join(self._plans_dir_str, filename)
             
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(plan.to_dict(), f, indent=2, ensure_ascii=False)
+            _write_json(filepath, plan.to_dict())
+            self._update_plans_index(filename, self._plan_summary(plan, self._file_stamp(filepath)))
             return True
         except Exception as e:
             print(f"Error saving plan: {e}")
@@ -188,53 +310,142 @@ class StorageManager:
     def load_plan(self, plan_id: str) -> Optional[StowagePlan]:
         """Load a stowage plan by ID"""
         try:
-            filename = f"{plan_id}.json"
-            filepath = self.plans_dir / filename
+            filepath = os.path.join(self._plans_dir_str, f"{plan_id}.json")
             
-            if not filepath.exists():
+            try:
+                stamp = self._file_stamp(filepath)
+            except FileNotFoundError:
                 return None
             
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return StowagePlan.from_dict(data)
+            return StowagePlan.from_dict(_read_plan_data(filepath, stamp))
         except Exception as e:
             print(f"Error loading plan: {e}")
             return None
     
-    def get_all_plans(self) -> List[StowagePlan]:
-        """Get all saved plans"""
-        plans = []
-        try:
-            for filepath in self.plans_dir.glob("*.json"):
-                try:
-                    with open(filepath, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        plan = StowagePlan.from_dict(data)
-                        plans.append(plan)
-                except Exception as e:
-                    print(f"Error loading plan from {filepath}: {e}")
-                    continue
-        except Exception as e:
-            print(f"Error listing plans: {e}")
-        
-        # Sort by creation date (newest first)
-        plans.sort(key=lambda p: p.created_date if p.created_date else datetime.min, reverse=True)
-        return plans
-    
     def delete_plan(self, plan_id: str) -> bool:
         """Delete a saved plan"""
         try:
             filename = f"{plan_id}.json"
-            filepath = self.plans_dir / filename
+            filepath = os.path.join(self._plans_dir_str, filename)
             
-            if filepath.exists():
-                filepath.unlink()
+            if os.path.exists(filepath):
+                os.unlink(filepath)
+                self._update_plans_index(filename, None)
                 return True
             return False
         except Exception as e:
             print(f"Error deleting plan: {e}")
             return False
     
+    def get_plan_summaries(self) -> List[Dict]:
+        """Get list metadata of all saved plans without loading them fully
+        
+        Served from plans_index_file; only plan files that are new or changed
+        since they were indexed get parsed, and the index is rewritten then.
+        
+        Returns:
+            List of dicts with 'id', 'plan_name', 'ship_name', 'created_date'
+            (datetime or None), 'cargo_count' and 'notes', newest first
+        """
+        summaries = []
+        try:
+            index = self._load_plans_index()
+            current = {}
+            stale = []
+            for entry in os.scandir(self.plans_dir):
+                name = entry.name
+                if not name.endswith('.json') or name == self.plans_index_file.name or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                stamp = [stat.st_mtime_ns, stat.st_size]
+                summary = index.get(name)
+                if summary is None or summary['stamp'] != stamp:
+                    stale.append((name, entry.path, stamp))
+                else:
+                    current[name] = summary
+            
+            plans = self._read_plan_files([path for _, path, _ in stale])
+            for (name, _, stamp), plan in zip(stale, plans):
+                if plan is not None:
+                    current[name] = self._plan_summary(plan, stamp)
+            
+            if current != index:
+                try:
+                    _write_json(self.plans_index_file, current)
+                    self._plans_index = current
+                except Exception as e:
+                    # The summaries are built already; the index is retried next time
+                    print(f"Error saving plans index: {e}")
+            
+            for summary in current.values():
+                summary = dict(summary)
+                del summary['stamp']
+                if summary['created_date']:
+                    summary['created_date'] = datetime.fromisoformat(summary['created_date'])
+                summaries.append(summary)
+        except Exception as e:
+            print(f"Error listing plans: {e}")
+        
+        # Sort by creation date (newest first)
+        summaries.sort(key=lambda s: s['created_date'] if s['created_date'] else datetime.min, reverse=True)
+        return summaries
+    
+    @staticmethod
+    def _read_plan_files(paths: list) -> List[Optional[StowagePlan]]:
+        """Load plan files, several at a time since this is mostly file I/O
+        
+        Returns:
+            One StowagePlan per path, or None where the file could not be loaded
+        """
+        def read_plan(path):
+            try:
+                return StowagePlan.from_dict(_read_json(path))
+            except Exception as e:
+                print(f"Error loading plan from {path}: {e}")
+                return None
+        
+        if len(paths) < 2:
+            return [read_plan(path) for path in paths]
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            return list(executor.map(read_plan, paths))
+    
+    @staticmethod
+    def _plan_summary(plan: StowagePlan, stamp) -> Dict:
+        """Build the plans index entry of a plan read from a file with the given stamp"""
+        return {
+            'id': plan.id,
+            'plan_name': plan.plan_name,
+            'ship_name': plan.ship_name,
+            'created_date': plan.created_date.isoformat() if plan.created_date else None,
+            'cargo_count': len(plan.cargo_requests),
+            'notes': plan.notes,
+            'stamp': list(stamp)
+        }
+    
+    def _load_plans_index(self) -> Dict[str, Dict]:
+        """Get the plans index, reading it from disk the first time"""
+        if self._plans_index is None:
+            try:
+                self._plans_index = _read_json(self.plans_index_file)
+            except Exception:
+                # Missing or unreadable: rebuilt by the next get_plan_summaries
+                self._plans_index = {}
+        return self._plans_index
+    
+    def _update_plans_index(self, filename: str, summary: Optional[Dict]):
+        """Add, replace (or with summary None, remove) one plans index entry"""
+        try:
+            index = dict(self._load_plans_index())
+            if summary is None:
+                index.pop(filename, None)
+            else:
+                index[filename] = summary
+            _write_json(self.plans_index_file, index)
+            self._plans_index = index
+        except Exception as e:
+            # get_plan_summaries re-validates every entry, so this is not fatal
+            print(f"Error updating plans index: {e}")
+    
     def save_plan_to_file(self, plan: StowagePlan, filepath: str) -> bool:
         """Save a stowage plan to a specific file path
         
@@ -250,8 +461,7 @@ class StorageManager:
             # Ensure parent directory exists
             file_path.parent.mkdir(parents=True, exist_ok=True)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(plan.to_dict(), f, indent=2, ensure_ascii=False)
+            _write_json(file_path, plan.to_dict(), pretty=True)
             return True
         except Exception as e:
             print(f"Error saving plan to file: {e}")
@@ -272,9 +482,7 @@ class StorageManager:
             if not file_path.exists():
                 return None
             
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-                return StowagePlan.from_dict(data)
+            return StowagePlan.from_dict(_read_json(file_path))
         except Exception as e:
             print(f"Error loading plan from file: {e}")
             return None
@@ -283,89 +491,83 @@ class StorageManager:
     
     def get_default_settings(self) -> Dict:
         """Get default optimization settings"""
-        return {
-            'optimization_algorithm': 'genetic',  # Default: Genetic Algorithm
-            'min_utilization': 0.65,
-            'drag_drop_warning_threshold': 0.70,
-            'score_weights': {
-                'single_fit': 0.40,
-                'symmetry': 0.25,
-                'bow_stern': 0.15,
-                'best_fit': 0.20
-            },
-            'waste_utilization_weights': {
-                'waste': 0.7,
-                'utilization': 0.3
-            },
-            'exact_fit_threshold': 0.01,
-            'bow_stern_violation_threshold': 3,
-            'symmetric_pair_min_threshold': 0.65,
-            # FAZ tolerance parameters
-            'faz1_single_tank_tolerance': 0.05,
-            'faz2_two_tank_tolerance': 0.05,
-            'faz2_asymmetric_tolerance_factor': 0.2,
-            'faz3_three_tank_tolerance': 0.04,
-            'faz4_four_tank_tolerance': 0.04,
-            'faz5_five_tank_tolerance': 0.04,
-            'mandatory_retry_increment': 0.01,
-            'mandatory_max_relaxation': 0.35,
-            # Genetic Algorithm parameters
-            'ga_population_size': 500,
-            'ga_max_generations': 2000,
-            'ga_crossover_rate': 0.90,
-            'ga_mutation_rate': 0.11,
-            'ga_tournament_size': 3,
-            'ga_use_elitism': True,
-            'ga_elitism_count': 5,
-            'ga_symmetry_penalty_coef': 3000.0,
-            'ga_trim_penalty_coef': 1500.0,
-            'ga_operational_penalty_coef': 100.0,
-            'ga_receiver_tolerance': 0.03,
-            'ga_convergence_threshold': 0.0001,
-            'ga_convergence_generations': 60
-        }
+        return {key: dict(value) if isinstance(value, dict) else value
+                for key, value in _DEFAULT_SETTINGS.items()}
     
     def load_optimization_settings(self) -> Dict:
-        """Load optimization settings from file, or return defaults"""
+        """Load optimization settings from file, or return defaults
+        
+        The merged settings are cached until the file's modification time or
+        size changes; callers get their own deep copy.
+        """
         try:
-            if not self.settings_file.exists():
-                return self.get_default_settings()
-            
-            with open(self.settings_file, 'r', encoding='utf-8') as f:
-                settings = json.load(f)
-                
-                # Merge with defaults to ensure all keys exist (deep merge for nested dicts)
-                defaults = self.get_default_settings()
-                # Start with defaults, then update with settings
-                # This preserves keys that exist in settings but not in defaults (like recent_plans, last_profile_id)
-                merged = defaults.copy()
-                # Merge nested dictionaries properly
-                for key in defaults:
-                    if key in settings and isinstance(defaults[key], dict) and isinstance(settings[key], dict):
-                        merged[key] = defaults[key].copy()
-                        merged[key].update(settings[key])
-                    elif key in settings:
-                        merged[key] = settings[key]
-                # Add any keys from settings that are not in defaults (like recent_plans, last_profile_id)
-                for key in settings:
-                    if key not in defaults:
-                        merged[key] = settings[key]
-                
-                return merged
+            return copy.deepcopy(self._current_settings())
         except Exception as e:
             print(f"Error loading optimization settings: {e}")
             return self.get_default_settings()
     
+    def _current_settings(self) -> Dict:
+        """Get the cached merged settings, re-reading the file if it changed
+        
+        Returns the cached dict itself (not a copy): only for internal
+        read-only use or in-place updates followed by _persist_settings.
+        """
+        try:
+            stamp = self._file_stamp(self.settings_file)
+        except FileNotFoundError:
+            return self.get_default_settings()
+        
+        if self._settings_cache is None or self._settings_cache[0] != stamp:
+            self._settings_cache = (stamp, self._merge_with_defaults(_read_json(self.settings_file)))
+        return self._settings_cache[1]
+    
+    def _merge_with_defaults(self, settings: Dict) -> Dict:
+        """Fill in default values for any settings missing from a loaded file"""
+        # Merge with defaults to ensure all keys exist (deep merge for nested dicts)
+        # Start with defaults, then update with settings
+        # This preserves keys that exist in settings but not in defaults (like recent_plans, last_profile_id)
+        merged = {}
+        # Merge nested dictionaries properly
+        for key, default in _DEFAULT_SETTINGS.items():
+            if key in settings:
+                value = settings[key]
+                if isinstance(default, dict) and isinstance(value, dict):
+                    value = {**default, **value}
+                merged[key] = value
+            else:
+                merged[key] = dict(default) if isinstance(default, dict) else default
+        # Add any keys from settings that are not in defaults (like recent_plans, last_profile_id)
+        for key in settings:
+            if key not in _DEFAULT_SETTINGS:
+                merged[key] = settings[key]
+        
+        return merged
+    
     def save_optimization_settings(self, settings: Dict) -> bool:
         """Save optimization settings to file"""
         try:
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, indent=2, ensure_ascii=False)
+            _write_json(self.settings_file, settings)
+            self._settings_cache = (
+                self._file_stamp(self.settings_file),
+                self._merge_with_defaults(copy.deepcopy(settings))
+            )
             return True
         except Exception as e:
             print(f"Error saving optimization settings: {e}")
             return False
     
+    def _persist_settings(self, settings: Dict) -> bool:
+        """Save settings from _current_settings and keep them as the cache"""
+        try:
+            _write_json(self.settings_file, settings)
+            self._settings_cache = (self._file_stamp(self.settings_file), settings)
+            return True
+        except Exception as e:
+            # The cached dict may already hold the unsaved change
+            self._settings_cache = None
+            print(f"Error saving optimization settings: {e}")
+            return False
+    
     # Last Profile Tracking Methods
     
     def save_last_profile_id(self, ship_id: str) -> bool:
@@ -378,12 +580,14 @@ class StorageManager:
             True if successful, False otherwise
         """
         try:
-            # Load current settings
-            settings = self.load_optimization_settings()
+            # Update current settings in place
+            settings = self._current_settings()
+            if settings.get('last_profile_id') == ship_id:
+                return True  # Already saved
             # Add or update last_profile_id
             settings['last_profile_id'] = ship_id
             # Save settings
-            return self.save_optimization_settings(settings)
+            return self._persist_settings(settings)
         except Exception as e:
             print(f"Error saving last profile ID: {e}")
             return False
@@ -395,8 +599,7 @@ class StorageManager:
             Ship profile ID if found, None otherwise
         """
         try:
-            settings = self.load_optimization_settings()
-            return settings.get('last_profile_id')
+            return self._current_settings().get('last_profile_id')
         except Exception as e:
             print(f"Error loading last profile ID: {e}")
             return None
@@ -413,27 +616,30 @@ class StorageManager:
             True if successful, False otherwise
         """
         try:
-            # Load current settings
-            settings = self.load_optimization_settings()
+            # Update current settings in place
+            settings = self._current_settings()
             
             # Get current recent plans list
             recent_plans = settings.get('recent_plans', [])
             
-            # Remove the file_path if it already exists (to avoid duplicates)
-            if file_path in recent_plans:
-                recent_plans.remove(file_path)
+            # Drop the file_path if it already exists (to avoid duplicates) and
+            # files that no longer exist (load_recent_plans only hides them)
+            recent_plans = [plan_path for plan_path in recent_plans
+                            if plan_path != file_path and Path(plan_path).exists()]
             
             # Add to the beginning of the list
             recent_plans.insert(0, file_path)
             
             # Keep only the last 5 plans
             recent_plans = recent_plans[:5]
+            if recent_plans == settings.get('recent_plans'):
+                return True  # Already saved
             
             # Update settings
             settings['recent_plans'] = recent_plans
             
             # Save settings
-            return self.save_optimization_settings(settings)
+            return self._persist_settings(settings)
         except Exception as e:
             print(f"Error saving recent plan: {e}")
             return False
@@ -445,20 +651,15 @@ class StorageManager:
             List of file paths (up to 5), most recent first
         """
         try:
-            settings = self.load_optimization_settings()
-            recent_plans = settings.get('recent_plans', [])
+            recent_plans = self._current_settings().get('recent_plans', [])
             
-            # Filter out non-existent files
+            # Filter out non-existent files; the stored list is cleaned up
+            # by the next save_recent_plan instead of writing settings here
             valid_plans = []
             for plan_path in recent_plans:
                 if Path(plan_path).exists():
                     valid_plans.append(plan_path)
             
-            # Update settings if some files were removed
-            if len(valid_plans) != len(recent_plans):
-                settings['recent_plans'] = valid_plans
-                self.save_optimization_settings(settings)
-            
             return valid_plans
         except Exception as e:
             print(f"Error loading recent plans: {e}")
@@ -1,16 +1,226 @@
 """Dialog/widget for cargo input"""
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QTableWidget, QTableWidgetItem, QPushButton,
+                             QTableView, QPushButton, QApplication,
                              QLineEdit, QDoubleSpinBox, QMessageBox,
-                             QHeaderView, QDialog, QDialogButtonBox, QCheckBox)
-from PyQt6.QtCore import Qt, pyqtSignal
+                             QHeaderView, QDialog, QDialogButtonBox, QCheckBox,
+                             QStyledItemDelegate, QStyleOptionButton, QStyle,
+                             QAbstractItemView)
+from PyQt6.QtCore import (Qt, pyqtSignal, QAbstractTableModel, QModelIndex,
+                          QPersistentModelIndex, QEvent, QSize)
 from typing import List
 
 from models.cargo import Cargo, Receiver
 from utils.validators import validate_positive_number
 
 
+# Qt enum members compared in CargoTableModel.data(), which runs per cell per paint
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole
+_CHECK_STATE_ROLE = Qt.ItemDataRole.CheckStateRole
+_CHECKED = Qt.CheckState.Checked
+_UNCHECKED = Qt.CheckState.Unchecked
+
+
+def _make_ton_input() -> QDoubleSpinBox:
+    """Create the ton spin box used by the cargo dialogs"""
+    spin_box = QDoubleSpinBox()
+    spin_box.setRange(0.01, 1000000)
+    spin_box.setSuffix(" ton")
+    spin_box.setDecimals(2)
+    return spin_box
+
+
+def _make_density_input() -> QDoubleSpinBox:
+    """Create the density spin box used by the cargo dialogs"""
+    spin_box = QDoubleSpinBox()
+    spin_box.setDecimals(3)
+    spin_box.setRange(0.01, 10.0)
+    spin_box.setSingleStep(0.01)
+    spin_box.setToolTip("Yoğunluk (ton/m³)")
+    return spin_box
+
+
+def _parse_receivers(receiver_text: str) -> List[Receiver]:
+    """Parse a comma separated list of receiver names, skipping empty ones"""
+    receivers = []
+    for name in receiver_text.split(','):
+        name = name.strip()
+        if name:
+            receivers.append(Receiver(name=name))
+    return receivers
+
+
+class CargoTableModel(QAbstractTableModel):
+    """Table model over the cargo list; the Cargo objects are the only copy of the data"""
+    
+    HEADERS = ["Yük Tipi", "Ton", "Density (ton/m³)", "Hacim (m³)", "Alıcı(lar)", "Mutlak", ""]
+    MANDATORY_COLUMN = 5
+    EDIT_COLUMN = 6
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._cargos: List[Cargo] = []
+        # Display strings of columns 0-4 per row, formatted once per change
+        self._texts: List[tuple] = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._cargos)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation == Qt.Orientation.Horizontal and role == Qt.ItemDataRole.DisplayRole:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def data(self, index, role=_DISPLAY_ROLE):
+        if not index.isValid():
+            return None
+        column = index.column()
+        
+        if role == _DISPLAY_ROLE:
+            if column < self.MANDATORY_COLUMN:
+                return self._texts[index.row()][column]
+            if column == self.EDIT_COLUMN:
+                return "Düzenle"
+        elif role == _CHECK_STATE_ROLE and column == self.MANDATORY_COLUMN:
+            return _CHECKED if self._cargos[index.row()].is_mandatory else _UNCHECKED
+        return None
+    
+    @staticmethod
+    def _row_texts(cargo: Cargo) -> tuple:
+        """Format the text columns of a cargo row"""
+        return (
+            cargo.cargo_type,
+            f"{cargo.ton:.2f}" if cargo.ton else "-",
+            f"{cargo.density:.3f}" if cargo.density else "-",
+            f"{cargo.quantity:.2f}",
+            ", ".join([r.name for r in cargo.receivers]) if cargo.receivers else "Genel"
+        )
+    
+    def flags(self, index):
+        flags = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.column() == self.MANDATORY_COLUMN:
+            flags |= Qt.ItemFlag.ItemIsUserCheckable
+        return flags
+    
+    def setData(self, index, value, role=Qt.ItemDataRole.EditRole):
+        if (index.isValid() and index.column() == self.MANDATORY_COLUMN
+                and role == _CHECK_STATE_ROLE):
+            self._cargos[index.row()].is_mandatory = Qt.CheckState(value) == _CHECKED
+            self.dataChanged.emit(index, index, [role])
+            return True
+        return False
+    
+    def cargo_at(self, row: int) -> Cargo:
+        """Get the cargo shown in a row"""
+        return self._cargos[row]
+    
+    def cargo_list(self) -> List[Cargo]:
+        """Get all cargos in display order"""
+        return list(self._cargos)
+    
+    def set_cargo_list(self, cargo_list: List[Cargo]):
+        """Replace all rows"""
+        self.beginResetModel()
+        self._cargos = list(cargo_list)
+        self._texts = [self._row_texts(cargo) for cargo in self._cargos]
+        self.endResetModel()
+    
+    def append_cargo(self, cargo: Cargo):
+        """Add a row at the end"""
+        row = len(self._cargos)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._cargos.append(cargo)
+        self._texts.append(self._row_texts(cargo))
+        self.endInsertRows()
+    
+    def replace_cargo(self, row: int, cargo: Cargo):
+        """Show another cargo in an existing row"""
+        self._cargos[row] = cargo
+        self._texts[row] = self._row_texts(cargo)
+        self.dataChanged.emit(self.index(row, 0), self.index(row, len(self.HEADERS) - 1))
+    
+    def remove_cargo(self, row: int):
+        """Remove a row"""
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._cargos[row]
+        del self._texts[row]
+        self.endRemoveRows()
+
+
+class ButtonDelegate(QStyledItemDelegate):
+    """Paints a push button in each cell of a column and reports clicks by row
+    
+    Used instead of a QPushButton cell widget per row.
+    """
+    
+    clicked = pyqtSignal(int)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._pressed_row = -1
+        self._pressed_index = QPersistentModelIndex()
+        # The view only sends a release to editorEvent when it lands on the
+        # pressed cell, so watch its viewport to clear the pressed button
+        self._view = parent if isinstance(parent, QAbstractItemView) else None
+        if self._view is not None:
+            self._view.viewport().installEventFilter(self)
+    
+    def _button_option(self, option, index) -> QStyleOptionButton:
+        button = QStyleOptionButton()
+        button.rect = option.rect.adjusted(2, 2, -2, -2)
+        button.text = index.data()
+        button.state = QStyle.StateFlag.State_Enabled
+        if index.row() == self._pressed_row:
+            button.state |= QStyle.StateFlag.State_Sunken
+        return button
+    
+    def paint(self, painter, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        style.drawControl(QStyle.ControlElement.CE_PushButton,
+                          self._button_option(option, index), painter, option.widget)
+    
+    def sizeHint(self, option, index):
+        style = option.widget.style() if option.widget else QApplication.style()
+        button = self._button_option(option, index)
+        text_size = option.fontMetrics.size(Qt.TextFlag.TextShowMnemonic, button.text)
+        size = style.sizeFromContents(QStyle.ContentsType.CT_PushButton, button, text_size, option.widget)
+        return QSize(size.width() + 4, size.height() + 4)
+    
+    def _clear_pressed(self):
+        """Forget the pressed button and repaint its cell raised"""
+        pressed_index = QModelIndex(self._pressed_index)
+        self._pressed_row = -1
+        self._pressed_index = QPersistentModelIndex()
+        if self._view is not None and pressed_index.isValid():
+            self._view.update(pressed_index)
+    
+    def editorEvent(self, event, model, option, index):
+        event_type = event.type()
+        if event_type == QEvent.Type.MouseButtonPress:
+            if event.button() == Qt.MouseButton.LeftButton and option.rect.contains(event.position().toPoint()):
+                self._pressed_row = index.row()
+                self._pressed_index = QPersistentModelIndex(index)
+                return True
+        elif event_type == QEvent.Type.MouseButtonRelease and self._pressed_row >= 0:
+            pressed_row = self._pressed_row
+            self._clear_pressed()
+            if index.row() == pressed_row and option.rect.contains(event.position().toPoint()):
+                self.clicked.emit(pressed_row)
+            return True
+        return super().editorEvent(event, model, option, index)
+    
+    def eventFilter(self, obj, event):
+        # A release away from the pressed cell is not sent to this delegate;
+        # clear the pressed state here in that case
+        if event.type() == QEvent.Type.MouseButtonRelease and self._pressed_row >= 0:
+            if self._view.indexAt(event.position().toPoint()) != QModelIndex(self._pressed_index):
+                self._clear_pressed()
+        return False
+
+
 class CargoInputDialog(QWidget):
     """Widget for entering cargo loading requests"""
     
@@ -20,6 +230,7 @@ class CargoInputDialog(QWidget):
     def __init__(self, parent=None, embedded: bool = False):
         super().__init__(parent)
         self.embedded = embedded
+        self._edit_dialog = None  # CargoEditDialog, created on first edit and reused
         self.init_ui()
     
     def init_ui(self):
@@ -27,21 +238,38 @@ class CargoInputDialog(QWidget):
         layout = QVBoxLayout(self)
         
         # Table for cargo entries - genişleyebilmeli (stretch faktörü 1)
-        self.cargo_table = QTableWidget()
-        self.cargo_table.setColumnCount(7)
-        self.cargo_table.setHorizontalHeaderLabels(["Yük Tipi", "Ton", "Density (ton/m³)", "Hacim (m³)", "Alıcı(lar)", "Mutlak", ""])
+        self.cargo_model = CargoTableModel(self)
+        # Mandatory checkbox toggles and edits come in as dataChanged
+        self.cargo_model.dataChanged.connect(self.cargo_list_changed)
+        self.cargo_table = QTableView()
+        self.cargo_table.setModel(self.cargo_model)
         self.cargo_table.setSortingEnabled(False)  # Disable automatic sorting to preserve user's order
-        self.cargo_table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
-        self.cargo_table.horizontalHeader().setSectionResizeMode(1, QHeaderView.ResizeMode.ResizeToContents)
-        self.cargo_table.horizontalHeader().setSectionResizeMode(2, QHeaderView.ResizeMode.ResizeToContents)
-        self.cargo_table.horizontalHeader().setSectionResizeMode(3, QHeaderView.ResizeMode.ResizeToContents)
-        self.cargo_table.horizontalHeader().setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
-        self.cargo_table.horizontalHeader().setSectionResizeMode(5, QHeaderView.ResizeMode.ResizeToContents)
-        self.cargo_table.horizontalHeader().setSectionResizeMode(6, QHeaderView.ResizeMode.ResizeToContents)
+        header = self.cargo_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        header.setSectionResizeMode(4, QHeaderView.ResizeMode.Stretch)
+        # Fixed widths for the short columns, fitting their widest expected text
+        # (ResizeToContents would measure every row again on each change)
+        cell_metrics = self.cargo_table.fontMetrics()
+        header_metrics = header.fontMetrics()
+        widest_text = {1: "9999999.99", 2: "99.999", 3: "9999999.99", 5: "", 6: "Düzenle"}
+        for column, text in widest_text.items():
+            width = max(cell_metrics.horizontalAdvance(text),
+                        header_metrics.horizontalAdvance(CargoTableModel.HEADERS[column])) + 24
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Fixed)
+            header.resizeSection(column, width)
+        # All rows keep the default height
+        self.cargo_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        
+        # Edit buttons are painted by a delegate, no widget per row
+        self.edit_button_delegate = ButtonDelegate(self.cargo_table)
+        self.edit_button_delegate.clicked.connect(self.edit_cargo)
+        self.cargo_table.setItemDelegateForColumn(CargoTableModel.EDIT_COLUMN, self.edit_button_delegate)
+        # Double-clicking a row's text opens the same edit dialog
+        self.cargo_table.doubleClicked.connect(self._on_cargo_double_clicked)
         
         # Make table read-only for embedded mode
         if self.embedded:
-            self.cargo_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+            self.cargo_table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)
         
         # Tabloyu stretch faktörü ile ekle - bölümün büyük kısmını kullanacak
         layout.addWidget(self.cargo_table, 1)
@@ -54,21 +282,12 @@ class CargoInputDialog(QWidget):
             self.cargo_type_input.setPlaceholderText("Yük tipi (örn: Gasoil)")
             input_group.addWidget(self.cargo_type_input)
             
-            self.ton_input = QDoubleSpinBox()
-            self.ton_input.setMinimum(0.01)
-            self.ton_input.setMaximum(1000000)
-            self.ton_input.setSuffix(" ton")
-            self.ton_input.setDecimals(2)
+            self.ton_input = _make_ton_input()
             self.ton_input.valueChanged.connect(self.calculate_volume)
             input_group.addWidget(self.ton_input)
             
-            self.density_input = QDoubleSpinBox()
-            self.density_input.setMinimum(0.01)
-            self.density_input.setMaximum(10.0)
-            self.density_input.setDecimals(3)
-            self.density_input.setSingleStep(0.01)
+            self.density_input = _make_density_input()
             self.density_input.setValue(0.85)  # Default density
-            self.density_input.setToolTip("Yoğunluk (ton/m³)")
             self.density_input.valueChanged.connect(self.calculate_volume)
             input_group.addWidget(self.density_input)
             
@@ -98,14 +317,9 @@ class CargoInputDialog(QWidget):
     
     def calculate_volume(self):
         """Calculate volume from ton and density"""
-        ton = self.ton_input.value()
-        density = self.density_input.value()
-        
-        if density > 0:
-            volume = ton / density
-            self.volume_label.setText(f"Hacim: {volume:.2f} m³")
-        else:
-            self.volume_label.setText("Hacim: 0.00 m³")
+        # density_input never goes below 0.01 (see _make_density_input)
+        volume = self.ton_input.value() / self.density_input.value()
+        self.volume_label.setText(f"Hacim: {volume:.2f} m³")
     
     def add_cargo(self):
         """Add a new cargo entry"""
@@ -130,40 +344,15 @@ class CargoInputDialog(QWidget):
         volume = ton / density
         
         # Parse receivers
-        receivers = []
-        if receiver_text:
-            receiver_names = [name.strip() for name in receiver_text.split(',')]
-            receivers = [Receiver(name=name) for name in receiver_names if name]
+        receivers = _parse_receivers(receiver_text)
         
         # Get mandatory flag
         is_mandatory = self.mandatory_checkbox.isChecked()
         
         # Add to table
-        row = self.cargo_table.rowCount()
-        self.cargo_table.insertRow(row)
-        
-        self.cargo_table.setItem(row, 0, QTableWidgetItem(cargo_type))
-        self.cargo_table.setItem(row, 1, QTableWidgetItem(f"{ton:.2f}"))
-        self.cargo_table.setItem(row, 2, QTableWidgetItem(f"{density:.3f}"))
-        self.cargo_table.setItem(row, 3, QTableWidgetItem(f"{volume:.2f}"))
-        receiver_names_str = ", ".join([r.name for r in receivers]) if receivers else "Genel"
-        self.cargo_table.setItem(row, 4, QTableWidgetItem(receiver_names_str))
-        
-        # Mandatory checkbox in table
-        mandatory_checkbox = QCheckBox()
-        mandatory_checkbox.setChecked(is_mandatory)
-        mandatory_checkbox.stateChanged.connect(lambda: self.cargo_list_changed.emit())
-        self.cargo_table.setCellWidget(row, 5, mandatory_checkbox)
-        
-        # Store cargo object in item data
         cargo = Cargo(cargo_type=cargo_type, quantity=volume, ton=ton, density=density, 
                      receivers=receivers, is_mandatory=is_mandatory)
-        self.cargo_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, cargo)
-        
-        # Edit button - use dynamic row finding to avoid closure issues
-        edit_btn = QPushButton("Düzenle")
-        edit_btn.clicked.connect(self._on_edit_button_clicked)
-        self.cargo_table.setCellWidget(row, 6, edit_btn)
+        self.cargo_model.append_cargo(cargo)
         
         # Clear inputs
         self.cargo_type_input.clear()
@@ -178,7 +367,7 @@ class CargoInputDialog(QWidget):
     
     def remove_selected_cargo(self):
         """Remove selected cargo entry"""
-        current_row = self.cargo_table.currentRow()
+        current_row = self.cargo_table.currentIndex().row()
         if current_row >= 0:
             reply = QMessageBox.question(
                 self,
@@ -187,138 +376,40 @@ class CargoInputDialog(QWidget):
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
             if reply == QMessageBox.StandardButton.Yes:
-                self.cargo_table.removeRow(current_row)
-                # Reconnect all edit buttons after row removal to fix closure issue
-                self._reconnect_edit_buttons()
+                self.cargo_model.remove_cargo(current_row)
                 # Emit signal
                 self.cargo_list_changed.emit()
         else:
             QMessageBox.warning(self, "Uyarı", "Lütfen silmek istediğiniz yükü seçin.")
     
-    def _reconnect_edit_buttons(self):
-        """Reconnect all edit buttons with correct row indices after row removal"""
-        for row in range(self.cargo_table.rowCount()):
-            # Get or create edit button
-            edit_btn = self.cargo_table.cellWidget(row, 6)
-            if edit_btn:
-                # Disconnect old signal
-                try:
-                    edit_btn.clicked.disconnect()
-                except TypeError:
-                    # No connections to disconnect
-                    pass
-            else:
-                # Create new button if missing
-                edit_btn = QPushButton("Düzenle")
-                self.cargo_table.setCellWidget(row, 6, edit_btn)
-            
-            # Reconnect with a method that finds the row dynamically
-            # This avoids closure issues by finding the row at click time
-            edit_btn.clicked.connect(self._on_edit_button_clicked)
-    
-    def _on_edit_button_clicked(self):
-        """Handle edit button click by finding the row dynamically"""
-        from PyQt6.QtWidgets import QPushButton
-        
-        # Get the button that was clicked
-        button = self.sender()
-        if not isinstance(button, QPushButton):
-            return
-        
-        # Find which row this button is in
-        for row in range(self.cargo_table.rowCount()):
-            if self.cargo_table.cellWidget(row, 6) == button:
-                self.edit_cargo(row)
-                return
-    
     def edit_cargo(self, row: int):
         """Edit cargo at specified row"""
-        cargo_item = self.cargo_table.item(row, 0)
-        if not cargo_item:
+        if not 0 <= row < self.cargo_model.rowCount():
             return
         
-        cargo = cargo_item.data(Qt.ItemDataRole.UserRole)
-        if not cargo:
-            return
+        cargo = self.cargo_model.cargo_at(row)
         
         # Open edit dialog
-        dialog = CargoEditDialog(self, cargo)
+        if self._edit_dialog is None:
+            self._edit_dialog = CargoEditDialog(self)
+        dialog = self._edit_dialog
+        dialog.load_cargo(cargo)
         if dialog.exec():
-            updated_cargo = dialog.get_cargo()
-            
-            # Update table
-            self.cargo_table.setItem(row, 0, QTableWidgetItem(updated_cargo.cargo_type))
-            ton_display = f"{updated_cargo.ton:.2f}" if updated_cargo.ton else "-"
-            density_display = f"{updated_cargo.density:.3f}" if updated_cargo.density else "-"
-            self.cargo_table.setItem(row, 1, QTableWidgetItem(ton_display))
-            self.cargo_table.setItem(row, 2, QTableWidgetItem(density_display))
-            self.cargo_table.setItem(row, 3, QTableWidgetItem(f"{updated_cargo.quantity:.2f}"))
-            receiver_names_str = ", ".join([r.name for r in updated_cargo.receivers]) if updated_cargo.receivers else "Genel"
-            self.cargo_table.setItem(row, 4, QTableWidgetItem(receiver_names_str))
-            
-            # Update mandatory checkbox
-            mandatory_widget = self.cargo_table.cellWidget(row, 5)
-            if mandatory_widget:
-                mandatory_widget.setChecked(updated_cargo.is_mandatory)
-            else:
-                mandatory_checkbox = QCheckBox()
-                mandatory_checkbox.setChecked(updated_cargo.is_mandatory)
-                mandatory_checkbox.stateChanged.connect(lambda: self.cargo_list_changed.emit())
-                self.cargo_table.setCellWidget(row, 5, mandatory_checkbox)
-            
-            # Update stored cargo
-            self.cargo_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, updated_cargo)
-            
-            # Emit signal
-            self.cargo_list_changed.emit()
+            # Update table (emits cargo_list_changed through dataChanged)
+            self.cargo_model.replace_cargo(row, dialog.get_cargo())
+    
+    def _on_cargo_double_clicked(self, index):
+        """Edit the double-clicked cargo (not on the checkbox or button columns)"""
+        if index.column() < CargoTableModel.MANDATORY_COLUMN:
+            self.edit_cargo(index.row())
     
     def get_cargo_list(self) -> List[Cargo]:
         """Get list of all cargo entries"""
-        cargo_list = []
-        
-        for row in range(self.cargo_table.rowCount()):
-            cargo_item = self.cargo_table.item(row, 0)
-            if cargo_item:
-                cargo = cargo_item.data(Qt.ItemDataRole.UserRole)
-                if cargo:
-                    # Update mandatory flag from checkbox
-                    mandatory_widget = self.cargo_table.cellWidget(row, 5)
-                    if mandatory_widget and isinstance(mandatory_widget, QCheckBox):
-                        cargo.is_mandatory = mandatory_widget.isChecked()
-                    cargo_list.append(cargo)
-        
-        return cargo_list
+        return self.cargo_model.cargo_list()
     
     def set_cargo_list(self, cargo_list: List[Cargo]):
         """Set cargo list (for loading saved plans)"""
-        self.cargo_table.setRowCount(0)
-        
-        for cargo in cargo_list:
-            row = self.cargo_table.rowCount()
-            self.cargo_table.insertRow(row)
-            
-            self.cargo_table.setItem(row, 0, QTableWidgetItem(cargo.cargo_type))
-            ton_display = f"{cargo.ton:.2f}" if cargo.ton else "-"
-            density_display = f"{cargo.density:.3f}" if cargo.density else "-"
-            self.cargo_table.setItem(row, 1, QTableWidgetItem(ton_display))
-            self.cargo_table.setItem(row, 2, QTableWidgetItem(density_display))
-            self.cargo_table.setItem(row, 3, QTableWidgetItem(f"{cargo.quantity:.2f}"))
-            receiver_names_str = ", ".join([r.name for r in cargo.receivers]) if cargo.receivers else "Genel"
-            self.cargo_table.setItem(row, 4, QTableWidgetItem(receiver_names_str))
-            
-            # Mandatory checkbox
-            mandatory_checkbox = QCheckBox()
-            mandatory_checkbox.setChecked(cargo.is_mandatory)
-            mandatory_checkbox.stateChanged.connect(lambda: self.cargo_list_changed.emit())
-            self.cargo_table.setCellWidget(row, 5, mandatory_checkbox)
-            
-            # Store cargo object
-            self.cargo_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, cargo)
-            
-            # Edit button (use default parameter to avoid closure issue)
-            edit_btn = QPushButton("Düzenle")
-            edit_btn.clicked.connect(lambda checked=False, r=row: self.edit_cargo(r))
-            self.cargo_table.setCellWidget(row, 6, edit_btn)
+        self.cargo_model.set_cargo_list(cargo_list)
 
 
 class CargoEditDialog(QDialog):
@@ -347,11 +438,7 @@ class CargoEditDialog(QDialog):
         # Ton
         ton_layout = QHBoxLayout()
         ton_layout.addWidget(QLabel("Ton:"))
-        self.ton_input = QDoubleSpinBox()
-        self.ton_input.setMinimum(0.01)
-        self.ton_input.setMaximum(1000000)
-        self.ton_input.setSuffix(" ton")
-        self.ton_input.setDecimals(2)
+        self.ton_input = _make_ton_input()
         self.ton_input.valueChanged.connect(self.calculate_volume)
         ton_layout.addWidget(self.ton_input)
         layout.addLayout(ton_layout)
@@ -359,12 +446,7 @@ class CargoEditDialog(QDialog):
         # Density
         density_layout = QHBoxLayout()
         density_layout.addWidget(QLabel("Density (ton/m³):"))
-        self.density_input = QDoubleSpinBox()
-        self.density_input.setMinimum(0.01)
-        self.density_input.setMaximum(10.0)
-        self.density_input.setDecimals(3)
-        self.density_input.setSingleStep(0.01)
-        self.density_input.setToolTip("Yoğunluk (ton/m³)")
+        self.density_input = _make_density_input()
         self.density_input.valueChanged.connect(self.calculate_volume)
         density_layout.addWidget(self.density_input)
         layout.addLayout(density_layout)
@@ -402,6 +484,11 @@ class CargoEditDialog(QDialog):
         buttons.rejected.connect(self.reject)
         layout.addWidget(buttons)
     
+    def load_cargo(self, cargo: Cargo):
+        """Show another cargo, for reusing the dialog"""
+        self.cargo = cargo
+        self.load_cargo_data()
+    
     def load_cargo_data(self):
         """Load cargo data into inputs"""
         self.cargo_type_input.setText(self.cargo.cargo_type)
@@ -421,19 +508,16 @@ class CargoEditDialog(QDialog):
         if self.cargo.receivers:
             receiver_names = ", ".join([r.name for r in self.cargo.receivers])
             self.receiver_input.setText(receiver_names)
+        else:
+            self.receiver_input.clear()
         
         self.mandatory_checkbox.setChecked(self.cargo.is_mandatory)
     
     def calculate_volume(self):
         """Calculate volume from ton and density"""
-        ton = self.ton_input.value()
-        density = self.density_input.value()
-        
-        if density > 0:
-            volume = ton / density
-            self.volume_label.setText(f"{volume:.2f} m³")
-        else:
-            self.volume_label.setText("0.00 m³")
+        # density_input never goes below 0.01 (see _make_density_input)
+        volume = self.ton_input.value() / self.density_input.value()
+        self.volume_label.setText(f"{volume:.2f} m³")
     
     def get_cargo(self) -> Cargo:
         """Get updated cargo object"""
@@ -443,12 +527,9 @@ class CargoEditDialog(QDialog):
         receiver_text = self.receiver_input.text().strip()
         
         # Calculate volume
-        volume = ton / density if density > 0 else 0.0
+        volume = ton / density
         
-        receivers = []
-        if receiver_text:
-            receiver_names = [name.strip() for name in receiver_text.split(',')]
-            receivers = [Receiver(name=name) for name in receiver_names if name]
+        receivers = _parse_receivers(receiver_text)
         
         return Cargo(
             cargo_type=cargo_type,
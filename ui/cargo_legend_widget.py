@@ -1,13 +1,52 @@
 """Widget for displaying cargo legend with drag-and-drop support"""
 
 from PyQt6.QtWidgets import (QWidget, QHBoxLayout, QLabel, QScrollArea,
-                             QFrame, QVBoxLayout)
+                             QFrame, QVBoxLayout, QApplication)
 from PyQt6.QtCore import Qt, QMimeData, QByteArray
 from PyQt6.QtGui import QDrag, QPixmap, QPainter, QColor, QFont
 import json
 
 from models.cargo import Cargo
 
+# WCAG linearized sRGB value (0-1) for each 8-bit channel value
+_SRGB_LIN = tuple(
+    v / 255.0 / 12.92 if v / 255.0 <= 0.03928 else ((v / 255.0 + 0.055) / 1.055) ** 2.4
+    for v in range(256)
+)
+
+# Text color per background, keyed by lowercase hex without '#'
+_CONTRAST_CACHE: dict[str, str] = {}
+
+# Stylesheet strings, built once per color
+_BG_QSS: dict[str, str] = {}
+_TEXT_QSS: dict[str, str] = {}
+_QTY_QSS: dict[str, str] = {}
+
+
+def _bg_qss(color: str) -> str:
+    """Card background stylesheet for a color"""
+    qss = _BG_QSS.get(color)
+    if qss is None:
+        qss = _BG_QSS[color] = f"background-color: {color}; border: 2px solid #333; border-radius: 5px;"
+    return qss
+
+
+def _text_qss(text_color: str) -> str:
+    """Cargo type / receiver label stylesheet for a text color"""
+    qss = _TEXT_QSS.get(text_color)
+    if qss is None:
+        qss = _TEXT_QSS[text_color] = f"color: {text_color}; font-weight: bold; font-size: 9pt;"
+    return qss
+
+
+def _qty_qss(qty_color: str) -> str:
+    """Quantity label stylesheet for a quantity color"""
+    qss = _QTY_QSS.get(qty_color)
+    if qss is None:
+        # More opaque white background (0.85) for better contrast, larger font (9pt)
+        qss = _QTY_QSS[qty_color] = f"color: {qty_color}; font-size: 9pt; font-weight: bold; background-color: rgba(255, 255, 255, 0.85); padding: 2px 4px; border-radius: 3px; border: 1px solid rgba(0, 0, 0, 0.2);"
+    return qss
+
 
 class DraggableCargoCard(QFrame):
     """Draggable card representing a cargo type"""
@@ -18,13 +57,19 @@ class DraggableCargoCard(QFrame):
         self.color = color
         self.loaded_quantity = loaded_quantity  # Quantity already loaded in tanks
         
+        # Drag MIME payload; cards are only reused for the same cargo ID
+        self._mime_payload = QByteArray(json.dumps({
+            "cargo_id": cargo.unique_id,
+            "type": "cargo"
+        }).encode())
+        
         self.setMinimumSize(120, 60)
         self.setMaximumSize(150, 75)
         self.setFrameStyle(QFrame.Shape.Box | QFrame.Shadow.Raised)
         self.setLineWidth(2)
         
         # Set background color
-        self.setStyleSheet(f"background-color: {color}; border: 2px solid #333; border-radius: 5px;")
+        self.setStyleSheet(_bg_qss(color))
         
         # Enable drag and drop
         self.setAcceptDrops(False)  # Don't accept drops, only drag
@@ -32,124 +77,139 @@ class DraggableCargoCard(QFrame):
         # Set cursor to indicate draggability
         self.setCursor(Qt.CursorShape.OpenHandCursor)
         
-        # Enable mouse tracking for drag
-        self.setMouseTracking(True)
+        # No mouse tracking: drags only need moves with the button held,
+        # which Qt delivers without it
         
         # Layout for card content
         layout = QVBoxLayout(self)
         layout.setContentsMargins(5, 3, 5, 3)
         layout.setSpacing(2)
         
+        # Choose text color based on background brightness with better contrast
+        text_qss = _text_qss(self._get_contrast_color(color))
+        
         # Cargo type name
-        name_label = QLabel(cargo.cargo_type)
-        name_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        name_label = self._make_label(layout, cargo.cargo_type, text_qss, word_wrap=True)
+        
+        # Receiver info - between cargo type and quantity, same style as cargo type
+        receiver_label = self._make_label(layout, cargo.get_receiver_names(), text_qss, word_wrap=True)
+        
+        # Quantity info - show only remaining quantity (text and style set below)
+        qty_label = self._make_label(layout)
+        
+        self.name_label = name_label
+        self.receiver_label = receiver_label
+        self.qty_label = qty_label
+        self._qty_color = None
+        self._drag_pixmap = None  # Cached drag preview, cleared when the card changes
+        self._drag_start_pos = None  # Press position while a drag may start
+        self.update_quantity_label()
+    
+    @staticmethod
+    def _make_label(layout: QVBoxLayout, text: str = "", style_sheet: str = "", word_wrap: bool = False) -> QLabel:
+        """Create a centered card label that lets mouse events through to the card"""
+        label = QLabel(text)
+        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        if style_sheet:
+            label.setStyleSheet(style_sheet)
+        label.setWordWrap(word_wrap)
+        label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Don't block mouse events
+        layout.addWidget(label)
+        return label
+    
+    def update_card(self, cargo: Cargo, color: str, loaded_quantity: float):
+        """Refresh the card in place for a (possibly edited) cargo, color and loaded quantity"""
+        self.cargo = cargo
+        self.name_label.setText(cargo.cargo_type)
+        self.receiver_label.setText(cargo.get_receiver_names())
+        
+        if color != self.color:
+            self.color = color
+            self.setStyleSheet(_bg_qss(color))
+            text_qss = _text_qss(self._get_contrast_color(color))
+            self.name_label.setStyleSheet(text_qss)
+            self.receiver_label.setStyleSheet(text_qss)
+        
+        self.loaded_quantity = loaded_quantity
+        self.update_quantity_label()
+    
+    def update_quantity_label(self):
+        """Show the remaining quantity for the current loaded quantity"""
+        self._drag_pixmap = None
+        remaining_qty = self.cargo.quantity - self.loaded_quantity
+        self.qty_label.setText(f"{remaining_qty:.0f} m³ kaldı")
         
-        # Choose text color based on background brightness with better contrast
-        text_color = self._get_contrast_color(color)
-        name_label.setStyleSheet(f"color: {text_color}; font-weight: bold; font-size: 9pt;")
-        name_label.setWordWrap(True)
-        name_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Don't block mouse events
-        layout.addWidget(name_label)
-        
-        # Receiver info - between cargo type and quantity
-        receiver_names = cargo.get_receiver_names()
-        receiver_label = QLabel(receiver_names)
-        receiver_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Use same style as cargo type (same font size, weight, and color)
-        receiver_label.setStyleSheet(f"color: {text_color}; font-weight: bold; font-size: 9pt;")
-        receiver_label.setWordWrap(True)
-        receiver_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Don't block mouse events
-        layout.addWidget(receiver_label)
-        
-        # Quantity info - show only remaining quantity
-        remaining_qty = cargo.quantity - self.loaded_quantity
-        qty_text = f"{remaining_qty:.0f} m³ kaldı"
         # Use high contrast colors for quantity with better background
         qty_color = "#FF0000" if remaining_qty > 0.001 else "#006600"  # Darker red/green for better contrast
-        
-        qty_label = QLabel(qty_text)
-        qty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        # Use more opaque white background (0.85) for better contrast, larger font (9pt)
-        qty_label.setStyleSheet(f"color: {qty_color}; font-size: 9pt; font-weight: bold; background-color: rgba(255, 255, 255, 0.85); padding: 2px 4px; border-radius: 3px; border: 1px solid rgba(0, 0, 0, 0.2);")
-        qty_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)  # Don't block mouse events
-        layout.addWidget(qty_label)
+        if qty_color != self._qty_color:
+            self._qty_color = qty_color
+            self.qty_label.setStyleSheet(_qty_qss(qty_color))
+    
+    def resizeEvent(self, event):
+        """Drop the cached drag preview when the card size changes"""
+        self._drag_pixmap = None
+        super().resizeEvent(event)
     
-    def _get_contrast_color(self, hex_color: str) -> str:
+    @staticmethod
+    def _get_contrast_color(hex_color: str) -> str:
         """Get contrasting text color (white or black) based on background brightness
         Uses improved contrast calculation for better readability"""
         # Remove # if present
-        hex_color = hex_color.lstrip('#')
+        key = hex_color.lower().lstrip('#')
+        cached = _CONTRAST_CACHE.get(key)
+        if cached is not None:
+            return cached
         
         # Handle short hex colors (e.g., #FFF -> #FFFFFF)
+        hex_color = key
         if len(hex_color) == 3:
             hex_color = ''.join([c*2 for c in hex_color])
         
         # Convert to RGB
         try:
-            r = int(hex_color[0:2], 16)
-            g = int(hex_color[2:4], 16)
-            b = int(hex_color[4:6], 16)
-        except (ValueError, IndexError):
+            if len(hex_color) < 6:
+                raise ValueError(hex_color)
+            rgb = int(hex_color[:6], 16)
+        except ValueError:
             # Fallback to black if color parsing fails
+            _CONTRAST_CACHE[key] = "#000000"
             return "#000000"
         
         # Calculate relative luminance using WCAG formula for better contrast
-        # Normalize RGB values to 0-1
-        def normalize(val):
-            val = val / 255.0
-            if val <= 0.03928:
-                return val / 12.92
-            return ((val + 0.055) / 1.055) ** 2.4
-        
-        r_norm = normalize(r)
-        g_norm = normalize(g)
-        b_norm = normalize(b)
-        
-        # Calculate relative luminance
-        luminance = 0.2126 * r_norm + 0.7152 * g_norm + 0.0722 * b_norm
+        luminance = (0.2126 * _SRGB_LIN[rgb >> 16 & 0xFF]
+                     + 0.7152 * _SRGB_LIN[rgb >> 8 & 0xFF]
+                     + 0.0722 * _SRGB_LIN[rgb & 0xFF])
         
         # Use higher threshold (0.4 instead of 0.5) to prefer black text for better readability
         # This ensures better contrast on medium-brightness backgrounds
-        return "#FFFFFF" if luminance < 0.4 else "#000000"
+        text_color = "#FFFFFF" if luminance < 0.4 else "#000000"
+        _CONTRAST_CACHE[key] = text_color
+        return text_color
     
     def mousePressEvent(self, event):
         """Handle mouse press to start drag"""
         if event.button() == Qt.MouseButton.LeftButton:
-            self.drag_start_position = event.position().toPoint()
-            self.dragging = False
+            self._drag_start_pos = event.position().toPoint()
         super().mousePressEvent(event)
     
     def mouseMoveEvent(self, event):
         """Handle mouse move to initiate drag"""
-        if not (event.buttons() & Qt.MouseButton.LeftButton):
+        if self._drag_start_pos is None or not (event.buttons() & Qt.MouseButton.LeftButton):
             super().mouseMoveEvent(event)
             return
         
-        if not hasattr(self, 'drag_start_position'):
+        # Check if moved enough to start drag (platform drag distance)
+        drag_distance = (event.position().toPoint() - self._drag_start_pos).manhattanLength()
+        if drag_distance < QApplication.startDragDistance():
             super().mouseMoveEvent(event)
             return
         
-        # Check if moved enough to start drag (minimum 3 pixels)
-        current_pos = event.position().toPoint()
-        drag_distance = (current_pos - self.drag_start_position).manhattanLength()
-        if drag_distance < 3:
-            super().mouseMoveEvent(event)
-            return
-        
-        # Prevent multiple drag starts
-        if hasattr(self, 'dragging') and self.dragging:
-            super().mouseMoveEvent(event)
-            return
-        
-        # Mark as dragging
-        self.dragging = True
+        # Clear the start position first so no second drag starts from this press
+        self._drag_start_pos = None
         
         # Start drag operation
         self._start_drag(event)
         
-        # Reset dragging flag
-        self.dragging = False
-        
         super().mouseMoveEvent(event)
     
     def _start_drag(self, event):
@@ -159,26 +219,26 @@ class DraggableCargoCard(QFrame):
         mime_data = QMimeData()
         
         # Set MIME data with cargo ID
-        cargo_data = {
-            "cargo_id": self.cargo.unique_id,
-            "type": "cargo"
-        }
-        mime_data.setData("application/x-cargo-id", QByteArray(json.dumps(cargo_data).encode()))
+        mime_data.setData("application/x-cargo-id", self._mime_payload)
         drag.setMimeData(mime_data)
         
-        # Create drag pixmap (preview) - use grab() for better quality
-        try:
-            pixmap = self.grab()
-        except:
-            # Fallback to manual pixmap creation
-            pixmap = QPixmap(self.size())
-            pixmap.fill(QColor(self.color))
-            painter = QPainter(pixmap)
-            text_color = self._get_contrast_color(self.color)
-            painter.setPen(QColor(text_color))
-            painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
-            painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, self.cargo.cargo_type)
-            painter.end()
+        # Create drag pixmap (preview) - use grab() for better quality,
+        # reusing the last one while the card is unchanged
+        pixmap = self._drag_pixmap
+        if pixmap is None or pixmap.isNull():
+            try:
+                pixmap = self.grab()
+            except:
+                # Fallback to manual pixmap creation
+                pixmap = QPixmap(self.size())
+                pixmap.fill(QColor(self.color))
+                painter = QPainter(pixmap)
+                text_color = self._get_contrast_color(self.color)
+                painter.setPen(QColor(text_color))
+                painter.setFont(QFont("Arial", 10, QFont.Weight.Bold))
+                painter.drawText(pixmap.rect(), Qt.AlignmentFlag.AlignCenter, self.cargo.cargo_type)
+                painter.end()
+            self._drag_pixmap = pixmap
         
         drag.setPixmap(pixmap)
         
@@ -194,10 +254,6 @@ class DraggableCargoCard(QFrame):
         
         # Reset cursor after drag
         self.setCursor(Qt.CursorShape.OpenHandCursor)
-        
-        # Clear drag start position after drag completes
-        if hasattr(self, 'drag_start_position'):
-            delattr(self, 'drag_start_position')
 
 
 class CargoLegendWidget(QWidget):
@@ -250,28 +306,39 @@ class CargoLegendWidget(QWidget):
         self.cargo_colors = cargo_colors
         self.current_plan = plan
         
-        # Clear existing cards
-        self._clear_cards()
-        
-        # Create cards for each cargo
-        for cargo, color in zip(cargo_list, cargo_colors):
-            # Calculate loaded quantity for this cargo
-            loaded_qty = 0.0
-            if plan:
-                loaded_qty = plan.get_cargo_total_loaded(cargo.unique_id)
+        # Repaint the container once after all cards are swapped
+        self.cards_container.setUpdatesEnabled(False)
+        try:
+            # Take the current cards out of the layout (keeping the stretch) so
+            # cards for cargos that are still listed can be reused in place
+            old_cards: dict[str, list[DraggableCargoCard]] = {}
+            while self.cards_layout.count() > 1:
+                item = self.cards_layout.takeAt(0)
+                card = item.widget() if item else None
+                if card:
+                    old_cards.setdefault(card.cargo.unique_id, []).append(card)
             
-            card = DraggableCargoCard(cargo, color, self, loaded_qty)
-            self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)  # Insert before stretch
-    
-    def _clear_cards(self):
-        """Clear all cargo cards"""
-        # Remove all widgets except the stretch
-        while self.cards_layout.count() > 1:  # Keep the stretch
-            item = self.cards_layout.takeAt(0)
-            if item:
-                widget = item.widget()
-                if widget:
-                    widget.deleteLater()
+            # Create or reuse a card for each cargo
+            for cargo, color in zip(cargo_list, cargo_colors):
+                # Calculate loaded quantity for this cargo
+                loaded_qty = 0.0
+                if plan:
+                    loaded_qty = plan.get_cargo_total_loaded(cargo.unique_id)
+            
+                reusable = old_cards.get(cargo.unique_id)
+                if reusable:
+                    card = reusable.pop(0)
+                    card.update_card(cargo, color, loaded_qty)
+                else:
+                    card = DraggableCargoCard(cargo, color, self, loaded_qty)
+                self.cards_layout.insertWidget(self.cards_layout.count() - 1, card)  # Insert before stretch
+            
+            # Remove cards for cargos that are no longer listed
+            for cards in old_cards.values():
+                for card in cards:
+                    card.deleteLater()
+        finally:
+            self.cards_container.setUpdatesEnabled(True)
     
     def update_loaded_quantities(self, plan):
         """Update loaded quantities for all cargo cards
@@ -300,20 +367,4 @@ class CargoLegendWidget(QWidget):
     
     def _update_card_quantity_label(self, card: DraggableCargoCard):
         """Update the quantity label on a cargo card"""
-        # Find the quantity label (third label in layout: cargo type, receiver, quantity)
-        layout = card.layout()
-        if layout and layout.count() >= 3:
-            qty_label = layout.itemAt(2).widget()  # Third widget (index 2)
-            if isinstance(qty_label, QLabel):
-                cargo = card.cargo
-                remaining_qty = cargo.quantity - card.loaded_quantity
-                
-                # Show only remaining quantity
-                qty_text = f"{remaining_qty:.0f} m³ kaldı"
-                # Use high contrast colors for quantity with better background
-                qty_color = "#FF0000" if remaining_qty > 0.001 else "#006600"  # Darker red/green for better contrast
-                
-                qty_label.setText(qty_text)
-                # Use more opaque white background (0.85) for better contrast, larger font (9pt)
-                qty_label.setStyleSheet(f"color: {qty_color}; font-size: 9pt; font-weight: bold; background-color: rgba(255, 255, 255, 0.85); padding: 2px 4px; border-radius: 3px; border: 1px solid rgba(0, 0, 0, 0.2);")
-
+        card.update_quantity_label()
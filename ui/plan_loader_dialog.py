@@ -73,30 +73,30 @@ class PlanLoaderDialog(QDialog):
     
     def load_plans(self):
         """Load all saved plans"""
-        plans = self.storage.get_all_plans()
+        plans = self.storage.get_plan_summaries()
         
         self.plans_table.setRowCount(len(plans))
         
         for row, plan in enumerate(plans):
-            self.plans_table.setItem(row, 0, QTableWidgetItem(plan.plan_name))
-            self.plans_table.setItem(row, 1, QTableWidgetItem(plan.ship_name))
+            self.plans_table.setItem(row, 0, QTableWidgetItem(plan['plan_name']))
+            self.plans_table.setItem(row, 1, QTableWidgetItem(plan['ship_name']))
             
             date_str = ""
-            if plan.created_date:
-                date_str = plan.created_date.strftime("%Y-%m-%d %H:%M")
+            if plan['created_date']:
+                date_str = plan['created_date'].strftime("%Y-%m-%d %H:%M")
             self.plans_table.setItem(row, 2, QTableWidgetItem(date_str))
             
-            cargo_count = len(plan.cargo_requests)
+            cargo_count = plan['cargo_count']
             self.plans_table.setItem(row, 3, QTableWidgetItem(str(cargo_count)))
             
             # Notes column - show truncated version if long
-            notes_text = plan.notes if plan.notes else ""
+            notes_text = plan['notes'] if plan['notes'] else ""
             if len(notes_text) > 50:
                 notes_text = notes_text[:47] + "..."
             self.plans_table.setItem(row, 4, QTableWidgetItem(notes_text))
             
             # Store plan ID in item data
-            self.plans_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, plan.id)
+            self.plans_table.item(row, 0).setData(Qt.ItemDataRole.UserRole, plan['id'])
     
     def accept_selection(self):
         """Accept the selected plan"""